@@ -6,20 +6,25 @@ Secured with Bearer token authentication.
 """
 
 import logging
-import subprocess
+import re
 import sys
 import os
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 
 # Add the zebra_print module to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from zebra_print.auth.token_manager import TokenManager
+from zebra_print.core.zpl_generator import json_to_zpl_bytes
+from zebra_print.core.print_batcher import PrintBatcher
+from zebra_print.printer.zebra_cups import list_printers
+from zebra_print.api.server_timing import StageTimer
 from zebra_print.api.models import (
     PrintRequest, PrintResponse, HealthResponse, PrinterStatusResponse,
     TokenRequest, TokenResponse, TokenListResponse, AuthInfoResponse,
@@ -62,27 +67,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Keywords identifying a Zebra queue by name, compiled once
+ZEBRA_PRINTER_PATTERN = re.compile(r'zebra|ztc|zpl|zd230', re.IGNORECASE)
+
 def get_zebra_printer_name():
     """Auto-detect Zebra printer from CUPS."""
     try:
-        result = subprocess.run(['lpstat', '-p'], capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                # Look for printer lines that contain Zebra keywords
-                if line.startswith('printer ') and any(keyword in line.lower() for keyword in ['zebra', 'ztc', 'zd230']):
-                    # Extract printer name from "printer NAME ..."
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        return parts[1]
-            
-            # If no Zebra printer found, return the first available printer
-            for line in lines:
-                if line.startswith('printer '):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        logger.warning(f"No Zebra printer found, using: {parts[1]}")
-                        return parts[1]
+        printer_names = list(list_printers())
+        for name in printer_names:
+            if ZEBRA_PRINTER_PATTERN.search(name):
+                return name
+        
+        # If no Zebra printer found, return the first available printer
+        if printer_names:
+            logger.warning(f"No Zebra printer found, using: {printer_names[0]}")
+            return printer_names[0]
                         
     except Exception as e:
         logger.error(f"Failed to detect printer: {e}")
@@ -107,67 +106,7 @@ async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(secur
     
     return {"token": token, "name": token_name}
 
-def json_to_zpl(label_data: dict) -> str:
-    """
-    Convert JSON label data directly to ZPL commands.
-    No PDF processing needed!
-    """
-    logger.info(f"[PROCESS] Converting {len(label_data['labels'])} labels to ZPL")
-    
-    zpl_commands = []
-    
-    # Printer initialization (once at the beginning)
-    zpl_commands.extend([
-        "^XA",
-        "^JUS",      # Auto-detect label length
-        "^MMT",      # Set media type to thermal transfer
-        "^MNY",      # Set continuous media
-        "^MTT",      # Set media type to thermal transfer
-        "^PON",      # Print orientation normal
-        "^PMN",      # Print mode normal
-        "^LRN",      # Label reverse normal
-        "^CI0",      # Change international font/encoding
-        "^XZ",
-        ""           # Blank line separator
-    ])
-    
-    # Generate ZPL for each label
-    for i, label in enumerate(label_data['labels']):
-        zpl_commands.extend([
-            "^XA",           # Start format
-            
-            # CALIBRATION AND POSITIONING COMMANDS
-            "^LL236",        # Set label length to 236 dots (30mm)
-            "^PW394",        # Set print width to 394 dots (50mm) 
-            "^LH0,0",        # Set label home position (top-left)
-            "^LT8",          # Set label top margin to 8 dots (reduced from 20)
-            "^PR2",          # Set print speed to 2 inches/second (slower for accuracy)
-            "^MD5",          # Set media darkness to 5 (medium)
-            "^JMA",          # Set media type to auto-detect
-            
-            # QR code only (no text) - repositioned to (25,40)
-            f"^FO25,40^BQN,2,5^FDLA,{label['qr_code']}^FS",
-            
-            # TEXT FIELDS WITH NEW LAYOUT - 18x18 SIZE (9 fields, no qr_code text)
-            f"^FO180,50^A0N,18,18^FD{label['do_number']}^FS",      # DO Number
-            f"^FO180,75^A0N,18,18^FD{label['route']} {label['date']}^FS",        # Route + Date
-            f"^FO180,100^A0N,18,18^FD{label['customer']}^FS",      # Customer
-            f"^FO180,125^A0N,18,18^FD{label['so_number']} {label['mo_number']}^FS",  # SO + MO Number
-            f"^FO180,150^A0N,18,18^FD{label['item']}^FS",          # Item
-            f"^FO180,175^A0N,18,18^FD{label['qty']} {label['uom']}^FS",  # Qty + UOM
-            
-            "^XZ"            # End format
-        ])
-        
-        # Add spacing between labels
-        if i < len(label_data['labels']) - 1:
-            zpl_commands.append("")
-    
-    zpl_string = "\n".join(zpl_commands)
-    logger.info(f"[OK] Generated ZPL with {len(label_data['labels'])} labels")
-    return zpl_string
-
-def print_to_zebra(zpl_commands: str):
+def print_to_zebra(zpl_commands: bytes):
     """Send ZPL commands to Zebra printer using cross-platform approach."""
     try:
         logger.info(f"[PRINTER] Sending ZPL to {PRINTER_NAME}")
@@ -196,6 +135,9 @@ def print_to_zebra(zpl_commands: str):
         logger.error(f"[ERROR] Print error: {e}")
         return False, f"Print system error: {e}"
 
+# Concurrent /print requests are coalesced into one printer job
+print_batcher = PrintBatcher(print_to_zebra)
+
 # API Endpoints
 
 @app.get("/", tags=["Info"])
@@ -219,6 +161,7 @@ async def health_check():
          tags=["Printing"])
 async def print_labels(
     request: PrintRequest,
+    response: Response,
     auth: dict = Depends(verify_token)
 ):
     """
@@ -227,15 +170,19 @@ async def print_labels(
     This endpoint receives label data and prints them directly to the configured Zebra printer
     using ZPL (Zebra Programming Language) commands.
     """
+    timer = StageTimer()
     try:
         logger.info(f"[POST] Received print request for {len(request.labels)} labels from token: {auth['name']}")
         
         # Convert to ZPL
         label_data = {"labels": [label.dict() for label in request.labels]}
-        zpl = json_to_zpl(label_data)
+        zpl = json_to_zpl_bytes(label_data)
+        timer.mark('zpl')
         
-        # Print to Zebra
-        success, message = print_to_zebra(zpl)
+        # Print to Zebra (lp/lpstat block, so keep them off the event loop)
+        success, message = await run_in_threadpool(print_batcher.submit, zpl)
+        timer.mark('print')
+        response.headers['Server-Timing'] = timer.header()
         
         if success:
             logger.info(f"[OK] Print request completed successfully")
@@ -277,10 +224,10 @@ async def printer_status(auth: dict = Depends(verify_token)):
             )
         
         # Re-detect printer in case it changed
-        current_printer = get_zebra_printer_name()
+        current_printer = await run_in_threadpool(get_zebra_printer_name)
         logger.info(f"[PRINTER] Using detected printer: {current_printer}")
         printer_service = get_zebra_printer(current_printer)
-        status_info = printer_service.get_status()
+        status_info = await run_in_threadpool(printer_service.get_status)
         
         # Map status to API response format
         if status_info.get('exists') and status_info.get('enabled'):
@@ -436,4 +383,6 @@ if __name__ == '__main__':
     else:
         logger.info("[AUTH] API authentication enabled - tokens required for protected endpoints")
     
+    # Single worker: print jobs are coalesced and tokens cached in this process.
+    # uvloop and httptools (uvicorn[standard]) are picked up automatically.
     uvicorn.run(app, host='0.0.0.0', port=5000, log_level="info")
\ No newline at end of file
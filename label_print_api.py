@@ -5,9 +5,10 @@ Local HTTP server that receives print requests from Odoo (cloud) and prints to l
 Secured with Bearer token authentication.
 """
 
-from flask import Flask, request, jsonify, g
+from flask import Flask, Response, request, jsonify, g
+import json
 import logging
-import subprocess
+import re
 from datetime import datetime
 import os
 import sys
@@ -16,8 +17,14 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from zebra_print.auth.token_manager import TokenManager
 from zebra_print.auth.middleware import AuthMiddleware
+from zebra_print.core.zpl_generator import json_to_zpl_bytes, LABEL_FIELDS, REQUIRED_LABEL_FIELDS
+from zebra_print.core.print_batcher import PrintBatcher
+from zebra_print.printer.zebra_cups import list_printers
+from zebra_print.api.json_provider import install_json_provider
+from zebra_print.api.server_timing import StageTimer
 
 app = Flask(__name__)
+install_json_provider(app)
 
 # Initialize authentication
 token_manager = TokenManager()
@@ -33,27 +40,21 @@ logging.basicConfig(
     ]
 )
 
+# Keywords identifying a Zebra queue by name, compiled once
+ZEBRA_PRINTER_PATTERN = re.compile(r'zebra|ztc|zpl|zd230', re.IGNORECASE)
+
 def get_zebra_printer_name():
     """Auto-detect Zebra printer from CUPS."""
     try:
-        result = subprocess.run(['lpstat', '-p'], capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                # Look for printer lines that contain Zebra keywords
-                if line.startswith('printer ') and any(keyword in line.lower() for keyword in ['zebra', 'ztc', 'zd230']):
-                    # Extract printer name from "printer NAME ..."
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        return parts[1]
-            
-            # If no Zebra printer found, return the first available printer
-            for line in lines:
-                if line.startswith('printer '):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        logging.warning(f"No Zebra printer found, using: {parts[1]}")
-                        return parts[1]
+        printer_names = list(list_printers())
+        for name in printer_names:
+            if ZEBRA_PRINTER_PATTERN.search(name):
+                return name
+        
+        # If no Zebra printer found, return the first available printer
+        if printer_names:
+            logging.warning(f"No Zebra printer found, using: {printer_names[0]}")
+            return printer_names[0]
                         
     except Exception as e:
         logging.error(f"Failed to detect printer: {e}")
@@ -64,85 +65,7 @@ def get_zebra_printer_name():
 PRINTER_NAME = get_zebra_printer_name()
 logging.info(f"[INIT] Using printer: {PRINTER_NAME}")
 
-def json_to_zpl(label_data):
-    """
-    Convert JSON label data directly to ZPL commands.
-    No PDF processing needed!
-    
-    Expected JSON format:
-    {
-        "labels": [
-            {
-                "qr_code": "01010101160",
-                "do_number": "W-CPN/OUT/00002", 
-                "route": "Route A",
-                "date": "12/04/22",
-                "customer": "Customer Name",
-                "so_number": "SO-67890",
-                "mo_number": "MO-12345",
-                "item": "Product Name",
-                "qty": "100",
-                "uom": "PCS"
-            }
-        ]
-    }
-    """
-    logging.info(f"[PROCESS] Converting {len(label_data['labels'])} labels to ZPL")
-    
-    zpl_commands = []
-    
-    # Printer initialization (once at the beginning)
-    zpl_commands.extend([
-        "^XA",
-        "^JUS",      # Auto-detect label length
-        "^MMT",      # Set media type to thermal transfer
-        "^MNY",      # Set continuous media
-        "^MTT",      # Set media type to thermal transfer
-        "^PON",      # Print orientation normal
-        "^PMN",      # Print mode normal
-        "^LRN",      # Label reverse normal
-        "^CI0",      # Change international font/encoding
-        "^XZ",
-        ""           # Blank line separator
-    ])
-    
-    # Generate ZPL for each label
-    for i, label in enumerate(label_data['labels']):
-        zpl_commands.extend([
-            "^XA",           # Start format
-            
-            # CALIBRATION AND POSITIONING COMMANDS
-            "^LL236",        # Set label length to 236 dots (30mm)
-            "^PW394",        # Set print width to 394 dots (50mm) 
-            "^LH0,0",        # Set label home position (top-left)
-            "^LT8",          # Set label top margin to 8 dots (reduced from 20)
-            "^PR2",          # Set print speed to 2 inches/second (slower for accuracy)
-            "^MD5",          # Set media darkness to 5 (medium)
-            "^JMA",          # Set media type to auto-detect
-            
-            # QR code only (no text) - repositioned to (25,40)
-            f"^FO25,40^BQN,2,5^FDLA,{label['qr_code']}^FS",
-            
-            # TEXT FIELDS WITH NEW LAYOUT - 18x18 SIZE (9 fields, no qr_code text)
-            f"^FO180,50^A0N,18,18^FD{label['do_number']}^FS",      # DO Number
-            f"^FO180,75^A0N,18,18^FD{label['route']} {label['date']}^FS",        # Route + Date
-            f"^FO180,100^A0N,18,18^FD{label['customer']}^FS",      # Customer
-            f"^FO180,125^A0N,18,18^FD{label['so_number']} {label['mo_number']}^FS",  # SO + MO Number
-            f"^FO180,150^A0N,18,18^FD{label['item']}^FS",          # Item
-            f"^FO180,175^A0N,18,18^FD{label['qty']} {label['uom']}^FS",  # Qty + UOM
-            
-            "^XZ"            # End format
-        ])
-        
-        # Add spacing between labels
-        if i < len(label_data['labels']) - 1:
-            zpl_commands.append("")
-    
-    zpl_string = "\n".join(zpl_commands)
-    logging.info(f"[OK] Generated ZPL with {len(label_data['labels'])} labels")
-    return zpl_string
-
-def print_to_zebra(zpl_commands):
+def print_to_zebra(zpl_commands: bytes):
     """Send ZPL commands to Zebra printer using cross-platform approach."""
     try:
         logging.info(f"[PRINTER] Sending ZPL to {PRINTER_NAME}")
@@ -171,14 +94,30 @@ def print_to_zebra(zpl_commands):
         logging.error(f"[ERROR] Print error: {e}")
         return False, f"Print system error: {e}"
 
+# Concurrent /print requests are coalesced into one printer job
+print_batcher = PrintBatcher(print_to_zebra)
+
+@app.before_request
+def start_stage_timer():
+    """Start timing the request; handlers mark their stages on g.timer."""
+    g.timer = StageTimer()
+
+@app.after_request
+def add_server_timing(response):
+    """Report the stages marked during the request in a Server-Timing header."""
+    timer = g.get('timer')
+    if timer is not None and timer.stages:
+        response.headers['Server-Timing'] = timer.header()
+    return response
+
+# /health body up to the timestamp, which is the only part that changes
+HEALTH_RESPONSE_PREFIX = b'{"status":"healthy","printer":%s,"timestamp":"' % json.dumps(PRINTER_NAME).encode()
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "printer": PRINTER_NAME
-    })
+    timestamp = datetime.now().isoformat(timespec='seconds').encode()
+    return Response(HEALTH_RESPONSE_PREFIX + timestamp + b'"}', mimetype='application/json')
 
 @app.route('/print', methods=['POST'])
 @auth_middleware.require_auth
@@ -205,6 +144,7 @@ def print_labels():
         ]
     }
     """
+    g.timer.mark('auth')
     try:
         # Validate request
         if not request.is_json:
@@ -220,19 +160,27 @@ def print_labels():
             return jsonify({"error": "'labels' must be a non-empty array"}), 400
         
         # Validate each label
-        required_fields = ['qr_code', 'do_number', 'route', 'date', 'customer', 'so_number', 'mo_number', 'item', 'qty', 'uom']
         for i, label in enumerate(data['labels']):
-            for field in required_fields:
-                if field not in label:
-                    return jsonify({"error": f"Label {i}: missing '{field}' field"}), 400
+            if not isinstance(label, dict):
+                return jsonify({"error": f"Label {i}: must be an object"}), 400
+            
+            missing = REQUIRED_LABEL_FIELDS - label.keys()
+            if missing:
+                # Report the first missing field in the documented order
+                field = next(f for f in LABEL_FIELDS if f in missing)
+                return jsonify({"error": f"Label {i}: missing '{field}' field"}), 400
         
         logging.info(f"[POST] Received print request for {len(data['labels'])} labels")
         
+        g.timer.mark('validate')
+        
         # Convert to ZPL
-        zpl = json_to_zpl(data)
+        zpl = json_to_zpl_bytes(data)
+        g.timer.mark('zpl')
         
         # Print to Zebra
-        success, message = print_to_zebra(zpl)
+        success, message = print_batcher.submit(zpl)
+        g.timer.mark('print')
         
         if success:
             response = {
@@ -463,4 +411,6 @@ if __name__ == '__main__':
     else:
         logging.info("[AUTH] API authentication enabled - tokens required for protected endpoints")
     
-    app.run(host='0.0.0.0', port=5000, debug=False)
\ No newline at end of file
+    # One process with a thread per request: print jobs are coalesced and
+    # tokens cached in this process, so it must not be split into workers
+    app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
\ No newline at end of file
@@ -4,14 +4,21 @@ PyTest configuration and fixtures for Zebra Print Control System tests.
 
 import pytest
 import os
+import subprocess
 import sys
 import tempfile
+import threading
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from zebra_print.database.db_manager import DatabaseManager
+from zebra_print.tunnel.cloudflare_named import CloudflareNamedTunnel
+
 @pytest.fixture
 def temp_db():
     """Provide temporary database for testing."""
@@ -19,11 +26,134 @@ def temp_db():
         yield f.name
     os.unlink(f.name)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def shared_db(tmp_path_factory):
+    """Provide one initialized database for a whole test module.
+    
+    Tables are created once instead of per test, so tests using it must
+    work with distinct rows rather than expect an empty database.
+    """
+    return DatabaseManager(str(tmp_path_factory.mktemp("db") / "zebra_print.db"))
+
+@pytest.fixture(scope="session")
+def tunnel():
+    """Provide one named tunnel instance for domain validation tests."""
+    return CloudflareNamedTunnel()
+
+@pytest.fixture(scope="session")
 def sample_label_data():
-    """Provide sample label data for testing."""
-    return {
+    """Provide read-only sample label data, shared by all tests."""
+    return types.MappingProxyType({
         "title": "W-CPN/OUT/TEST",
         "date": "08/08/25",
         "qr_code": "TEST123456"
-    }
\ No newline at end of file
+    })
+
+@pytest.fixture
+def sample_label_factory(sample_label_data):
+    """Provide a factory for mutable copies of the sample label, with overrides."""
+    return lambda **overrides: {**sample_label_data, **overrides}
+@pytest.fixture
+def fake_command(tmp_path, monkeypatch):
+    """Provide a factory that puts stand-in command line tools first on PATH.
+    
+    ``fake_command(name, body)`` writes a shell script named ``name`` and
+    returns its path; the body can save stdin with ``cat > "$0.stdin"``.
+    """
+    if sys.platform == "win32":
+        pytest.skip("uses shell scripts as command line tools")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    def install(name, body):
+        script = bin_dir / name
+        script.write_text(f"#!/bin/sh\n{body}\n")
+        script.chmod(0o755)
+        return script
+
+    return install
+
+@pytest.fixture
+def fake_cups(monkeypatch):
+    """Stand in for the optional pycups module used by the CUPS printer.
+    
+    By default cupsd is unreachable, so printing goes through lp; tests set
+    ``fake_cups.Connection`` to build their own connection.
+    """
+    from zebra_print.printer import zebra_cups
+
+    class IPPError(Exception):
+        pass
+
+    class HTTPError(Exception):
+        pass
+
+    def unreachable():
+        raise RuntimeError("failed to connect to server")
+
+    module = types.SimpleNamespace(
+        Connection=unreachable,
+        IPPError=IPPError,
+        HTTPError=HTTPError,
+        CUPS_FORMAT_RAW="application/vnd.cups-raw",
+    )
+    monkeypatch.setattr(zebra_cups, "cups", module)
+    monkeypatch.setattr(zebra_cups._cups_local, "conn", None, raising=False)
+    return module
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    """Answer every GET with the server's configured status and body."""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+        if self.path == "/slow":
+            server.release.wait(5)
+        self.send_response(server.status)
+        self.send_header("Content-Length", str(len(server.body)))
+        self.end_headers()
+        self.wfile.write(server.body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def health_server():
+    """Provide a local HTTP server standing in for a running label print API.
+    
+    Set ``status`` and ``body`` to change its answer; ``requests`` counts
+    the requests it has received, and ``/slow`` blocks until ``release``
+    is set.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _HealthHandler)
+    server.daemon_threads = True
+    server.status = 200
+    server.body = b'{"status":"ok"}'
+    server.requests = 0
+    server.lock = threading.Lock()
+    server.release = threading.Event()
+    server.port = server.server_address[1]
+    server.url = lambda path="/health": f"http://127.0.0.1:{server.port}{path}"
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.release.set()
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def running_process():
+    """Provide a child process that keeps running until the test ends."""
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    yield process
+    process.kill()
+    process.wait()
+
+@pytest.fixture
+def exited_pid():
+    """Provide the PID of a child process that has already exited."""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
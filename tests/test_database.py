@@ -4,16 +4,16 @@ Unit tests for database functionality.
 
 import pytest
 from datetime import datetime
-from zebra_print.database.db_manager import DatabaseManager
+from zebra_print.database.db_manager import DatabaseManager, SCHEMA_VERSION
 from zebra_print.database.models import TunnelConfig, SystemState, PrinterConfig
 
 
 class TestDatabaseManager:
     """Test database manager functionality."""
     
-    def test_database_initialization(self, temp_db):
+    def test_database_initialization(self, shared_db):
         """Test database initializes with correct tables."""
-        db = DatabaseManager(temp_db)
+        db = shared_db
         
         # Test database file is created
         assert db.db_path.exists()
@@ -29,9 +29,29 @@ class TestDatabaseManager:
             assert 'system_state' in table_names
             assert 'printer_configs' in table_names
     
-    def test_tunnel_config_crud(self, temp_db):
+    def test_database_uses_wal(self, shared_db):
+        """Test database is switched to write-ahead logging."""
+        db = shared_db
+        
+        with db.get_connection() as conn:
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        
+        assert journal_mode == 'wal'
+    
+    def test_schema_version_recorded(self, shared_db):
+        """Test reopening an initialized database keeps its schema and data."""
+        db = shared_db
+        db.save_system_state(SystemState(component="schema_check", is_configured=True))
+        
+        reopened = DatabaseManager(str(db.db_path))
+        
+        with reopened.get_connection() as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert reopened.get_system_state("schema_check").is_configured is True
+    
+    def test_tunnel_config_crud(self, shared_db):
         """Test tunnel configuration CRUD operations."""
-        db = DatabaseManager(temp_db)
+        db = shared_db
         
         # Create
         config = TunnelConfig(
@@ -57,9 +77,9 @@ class TestDatabaseManager:
         assert updated.is_active is True
         assert updated.current_url == "https://test.example.com"
     
-    def test_system_state_management(self, temp_db):
+    def test_system_state_management(self, shared_db):
         """Test system state management."""
-        db = DatabaseManager(temp_db)
+        db = shared_db
         
         state = SystemState(
             component="api_server",
@@ -76,9 +96,9 @@ class TestDatabaseManager:
         assert retrieved.is_configured is True
         assert retrieved.config_data == {"port": 5000}
     
-    def test_printer_config_management(self, temp_db):
+    def test_printer_config_management(self, shared_db):
         """Test printer configuration management."""
-        db = DatabaseManager(temp_db)
+        db = shared_db
         
         config = PrinterConfig(
             name="Test-Printer",
@@ -10,19 +10,16 @@ from zebra_print.database.db_manager import DatabaseManager
 class TestDomainInput:
     """Test domain input and validation."""
     
-    def test_valid_domain_setting(self, temp_db):
+    @pytest.mark.parametrize("domain", [
+        "tln-zebra-01.abcfood.app",
+        "printer-hq.mycompany.com",
+        "zebra-label.mydomain.org"
+    ])
+    def test_valid_domain_setting(self, tunnel, domain):
         """Test setting valid domains."""
-        tunnel = CloudflareNamedTunnel()
-        test_domains = [
-            "tln-zebra-01.abcfood.app",
-            "printer-hq.mycompany.com", 
-            "zebra-label.mydomain.org"
-        ]
-        
-        for domain in test_domains:
-            success, message = tunnel.set_custom_domain(domain)
-            assert success, f"Failed to set domain {domain}: {message}"
-            assert domain in message
+        success, message = tunnel.set_custom_domain(domain)
+        assert success, f"Failed to set domain {domain}: {message}"
+        assert domain in message
     
     def test_domain_storage(self, temp_db):
         """Test domain storage in database."""
@@ -38,21 +35,17 @@ class TestDomainInput:
         assert stored_config.domain_mapping == test_domain
         assert stored_config.is_configured is True
     
-    def test_invalid_domain_formats(self):
+    @pytest.mark.parametrize("domain", [
+        "",
+        "invalid",
+        "UPPERCASE.COM",
+        "domain with spaces.com",
+        "domain..com"
+    ])
+    def test_invalid_domain_formats(self, tunnel, domain):
         """Test validation of invalid domain formats."""
-        tunnel = CloudflareNamedTunnel()
-        
-        invalid_domains = [
-            "",
-            "invalid",
-            "UPPERCASE.COM",
-            "domain with spaces.com",
-            "domain..com"
-        ]
-        
-        for domain in invalid_domains:
-            success, _ = tunnel.set_custom_domain(domain)
-            assert not success, f"Should reject invalid domain: {domain}"
+        success, _ = tunnel.set_custom_domain(domain)
+        assert not success, f"Should reject invalid domain: {domain}"
     
     def test_webhook_url_generation(self, temp_db):
         """Test webhook URL generation."""
@@ -71,29 +64,23 @@ class TestDomainInput:
 class TestDomainValidation:
     """Test domain validation logic."""
     
-    def test_domain_format_validation(self):
-        """Test domain format validation."""
-        tunnel = CloudflareNamedTunnel()
-        
-        # Valid domains
-        valid_domains = [
-            "sub.domain.com",
-            "multi-word-sub.domain.org",
-            "test123.example.net"
-        ]
-        
-        for domain in valid_domains:
-            success, _ = tunnel.set_custom_domain(domain)
-            assert success, f"Valid domain rejected: {domain}"
-        
-        # Invalid domains
-        invalid_domains = [
-            "no-dots",
-            ".starts-with-dot.com",
-            "ends-with-dot.com.",
-            "has..double.dots.com"
-        ]
-        
-        for domain in invalid_domains:
-            success, _ = tunnel.set_custom_domain(domain)
-            assert not success, f"Invalid domain accepted: {domain}"
\ No newline at end of file
+    @pytest.mark.parametrize("domain", [
+        "sub.domain.com",
+        "multi-word-sub.domain.org",
+        "test123.example.net"
+    ])
+    def test_valid_domain_format(self, tunnel, domain):
+        """Test valid domain formats are accepted."""
+        success, _ = tunnel.set_custom_domain(domain)
+        assert success, f"Valid domain rejected: {domain}"
+    
+    @pytest.mark.parametrize("domain", [
+        "no-dots",
+        ".starts-with-dot.com",
+        "ends-with-dot.com.",
+        "has..double.dots.com"
+    ])
+    def test_invalid_domain_format(self, tunnel, domain):
+        """Test invalid domain formats are rejected."""
+        success, _ = tunnel.set_custom_domain(domain)
+        assert not success, f"Invalid domain accepted: {domain}"
\ No newline at end of file
@@ -0,0 +1,194 @@
+"""
+Unit tests for the Flask API service manager.
+"""
+
+import builtins
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+import pytest
+from zebra_print.api.flask_service import FlaskAPIService, HEALTH_CACHE_TTL, HEALTH_FAILURE_CACHE_TTL
+
+
+@pytest.fixture
+def api_service(health_server, tmp_path):
+    """Provide an API service pointed at the local health server, with its own PID file."""
+    service = FlaskAPIService(port=health_server.port, host="127.0.0.1")
+    service.pid_file = str(tmp_path / "api.pid")
+    yield service
+    service.close()
+
+
+class TestHealthCheck:
+    """Test health check caching."""
+
+    def test_repeated_checks_share_one_probe(self, api_service, health_server):
+        """Test back-to-back health checks reuse the cached result."""
+        assert api_service._health_check() is True
+        assert api_service._health_check() is True
+
+        assert health_server.requests == 1
+
+    def test_zero_ttl_forces_probe(self, api_service, health_server):
+        """Test ttl=0 bypasses the cached result."""
+        api_service._health_check()
+        health_server.status = 503
+
+        assert api_service._health_check(ttl=0) is False
+
+    def test_failure_cached_for_less_time(self, api_service, health_server):
+        """Test an old failure is re-probed while an equally old success is reused."""
+        checked_at = time.monotonic() - (HEALTH_FAILURE_CACHE_TTL + HEALTH_CACHE_TTL) / 2
+        health_server.status = 503
+
+        api_service._health_cache = (checked_at, True)
+        assert api_service._health_check() is True
+
+        api_service._health_cache = (checked_at, False)
+        health_server.status = 200
+        assert api_service._health_check() is True
+        assert health_server.requests == 1
+
+
+class TestStartupWait:
+    """Test waiting for a newly started server."""
+
+    def test_returns_once_healthy(self, api_service, health_server, running_process):
+        """Test the wait ends on the first successful probe."""
+        assert api_service._wait_until_ready(running_process, timeout=3) is True
+        assert health_server.requests == 1
+
+    def test_stops_when_process_exits(self, api_service, health_server):
+        """Test the wait gives up early if the server process died."""
+        health_server.status = 503
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+
+        started = time.monotonic()
+        assert api_service._wait_until_ready(process, timeout=3) is False
+        assert time.monotonic() - started < 1
+
+
+class TestPidFile:
+    """Test reading the server PID file."""
+
+    def test_unchanged_file_read_once(self, api_service, monkeypatch):
+        """Test the PID is served from memory while the file is unchanged."""
+        with open(api_service.pid_file, "w") as f:
+            f.write("1234")
+        pid_file_opens = 0
+        real_open = builtins.open
+
+        def counting_open(file, *args, **kwargs):
+            nonlocal pid_file_opens
+            if file == api_service.pid_file:
+                pid_file_opens += 1
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", counting_open)
+
+        assert api_service._read_pid() == 1234
+        assert api_service._read_pid() == 1234
+        assert pid_file_opens == 1
+
+    def test_rewritten_file_is_reread(self, api_service):
+        """Test a new PID written to the file is picked up."""
+        pid_file = Path(api_service.pid_file)
+        pid_file.write_text("1234")
+        api_service._read_pid()
+
+        pid_file.write_text("5678")
+        os.utime(pid_file, ns=(0, pid_file.stat().st_mtime_ns + 1))
+
+        assert api_service._read_pid() == 5678
+
+    def test_rewrite_within_one_timestamp_tick_is_reread(self, api_service):
+        """Test a new PID is picked up even if the mtime did not change."""
+        pid_file = Path(api_service.pid_file)
+        pid_file.write_text("1234")
+        mtime_ns = pid_file.stat().st_mtime_ns
+        api_service._read_pid()
+
+        pid_file.write_text("56789")
+        os.utime(pid_file, ns=(mtime_ns, mtime_ns))
+
+        assert api_service._read_pid() == 56789
+
+    def test_stop_forgets_cached_pid(self, api_service, exited_pid):
+        """Test a PID file written after stop() is read afresh."""
+        pid_file = Path(api_service.pid_file)
+        pid_file.write_text(str(exited_pid))
+        mtime_ns = pid_file.stat().st_mtime_ns
+        api_service._read_pid()
+
+        assert api_service.stop() == (True, "API server stopped")
+        assert not pid_file.exists()
+
+        # Same size and mtime as before, as after a fast restart
+        new_pid = exited_pid + 1 if len(str(exited_pid + 1)) == len(str(exited_pid)) else exited_pid - 1
+        pid_file.write_text(str(new_pid))
+        os.utime(pid_file, ns=(mtime_ns, mtime_ns))
+
+        assert api_service._read_pid() == new_pid
+
+    def test_stale_pid_file_removed(self, tmp_path, exited_pid):
+        """Test is_running drops a PID file whose process has exited."""
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            service = FlaskAPIService(port=probe.getsockname()[1], host="127.0.0.1")
+        service.pid_file = str(tmp_path / "api.pid")
+        Path(service.pid_file).write_text(str(exited_pid))
+
+        assert service.is_running() is False
+        assert not Path(service.pid_file).exists()
+
+
+class TestStatusCache:
+    """Test get_status caching."""
+
+    def test_repeated_status_reused(self, api_service, health_server):
+        """Test back-to-back status calls share one check and return copies."""
+        first = api_service.get_status()
+        first['running'] = False
+        health_server.shutdown()
+        health_server.server_close()
+
+        second = api_service.get_status()
+
+        assert second['running'] is True
+        assert second['health'] is True
+
+    def test_pid_file_change_invalidates(self, api_service, running_process):
+        """Test writing the PID file forces a fresh status."""
+        assert api_service.get_status()['pid'] is None
+
+        Path(api_service.pid_file).write_text(str(running_process.pid))
+
+        assert api_service.get_status()['pid'] == running_process.pid
+
+
+class TestPortCheck:
+    """Test the TCP liveness check."""
+
+    def test_listening_port_is_open(self, api_service, health_server):
+        """Test a listening server on the API port is detected without HTTP."""
+        assert api_service._port_open() is True
+        assert health_server.requests == 0
+
+    def test_closed_port_is_not_open(self):
+        """Test nothing listening on the port reports not running."""
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            service = FlaskAPIService(port=probe.getsockname()[1], host="127.0.0.1")
+
+        assert service._port_open() is False
+
+    def test_client_urls_use_localhost_for_wildcard_bind(self):
+        """Test a server bound to 0.0.0.0 is reported and probed via localhost."""
+        status = FlaskAPIService(port=5999).get_status()
+
+        assert status['host'] == "localhost"
+        assert status['url'] == "http://localhost:5999"
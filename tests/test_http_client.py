@@ -0,0 +1,71 @@
+"""
+Unit tests for the HTTP API client.
+"""
+
+import threading
+import pytest
+from zebra_print.api.http_client import HTTPAPIClient
+
+
+@pytest.fixture
+def client():
+    """Provide an HTTP API client, closed after the test."""
+    service = HTTPAPIClient(timeout=5)
+    yield service
+    service.close()
+
+
+class TestHealthCheck:
+    """Test health check caching."""
+
+    def test_repeated_checks_share_one_request(self, client, health_server):
+        """Test back-to-back checks of the same URL reuse the cached result."""
+        assert client.health_check(health_server.url()) == (True, {"status": "ok"})
+        assert client.health_check(health_server.url()) == (True, {"status": "ok"})
+
+        assert health_server.requests == 1
+
+    def test_urls_cached_separately(self, client, health_server):
+        """Test a different URL is not answered from another URL's result."""
+        client.health_check(health_server.url())
+        health_server.status = 503
+        health_server.body = b"unavailable"
+
+        success, data = client.health_check(health_server.url("/other/health"))
+
+        assert success is False
+        assert data["error"] == "HTTP 503"
+
+    def test_slow_url_does_not_block_other_urls(self, client, health_server):
+        """Test a check stuck on one URL does not hold up cache hits for another."""
+        client.health_check(health_server.url())
+        stuck = threading.Thread(target=client.health_check, args=(health_server.url("/slow"),))
+        stuck.start()
+        try:
+            finished = threading.Event()
+            threading.Thread(target=lambda: (client.health_check(health_server.url()), finished.set())).start()
+            assert finished.wait(1)
+        finally:
+            health_server.release.set()
+            stuck.join(5)
+
+    def test_zero_ttl_forces_request(self, client, health_server):
+        """Test ttl=0 bypasses the cached result."""
+        client.health_check(health_server.url())
+        health_server.status = 503
+        health_server.body = b"unavailable"
+
+        success, data = client.health_check(health_server.url(), ttl=0)
+
+        assert success is False
+        assert data["error"] == "HTTP 503"
+
+    def test_error_body_preview_is_bounded(self, client, health_server):
+        """Test only the start of a large error body is kept."""
+        health_server.status = 500
+        health_server.body = b"x" * 100000
+
+        success, data = client.health_check(health_server.url())
+
+        assert success is False
+        assert data["response"] == "x" * 200
@@ -0,0 +1,37 @@
+"""
+Unit tests for the Flask JSON provider.
+"""
+
+import pytest
+from flask import Flask, jsonify
+from zebra_print.api.json_provider import OrjsonProvider, install_json_provider
+
+pytest.importorskip("orjson")
+
+
+@pytest.fixture
+def app():
+    """Provide a Flask app using the orjson provider."""
+    app = Flask(__name__)
+    install_json_provider(app)
+
+    @app.route('/echo', methods=['POST'])
+    def echo():
+        return jsonify(request_data=app.json.loads(app.json.dumps({1: "one"})))
+
+    return app
+
+
+class TestOrjsonProvider:
+    """Test JSON handling through orjson."""
+
+    def test_provider_installed(self, app):
+        """Test the app uses the orjson provider."""
+        assert isinstance(app.json, OrjsonProvider)
+
+    def test_jsonify_round_trip(self, app):
+        """Test responses are valid JSON with the JSON mimetype."""
+        response = app.test_client().post('/echo', json={"labels": []})
+
+        assert response.content_type == "application/json"
+        assert response.get_json() == {"request_data": {"1": "one"}}
@@ -3,18 +3,42 @@ Integration tests for the modular Zebra Print Control System.
 """
 
 import pytest
+import socket
 import time
 from zebra_print.main import ZebraPrintApplication
 from zebra_print.database.models import SystemState
 
 
+@pytest.fixture(scope="class")
+def app():
+    """Provide one application instance per test class.
+    
+    The full dependency graph (API service, printer, tunnels, database,
+    label service, menu) is built once per class instead of per test.
+    """
+    return ZebraPrintApplication()
+
+
+def _wait_port(port, want_open, timeout=3.0):
+    """Poll the local port until it is open (or closed); False on timeout."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+                is_open = True
+        except OSError:
+            is_open = False
+        if is_open == want_open:
+            return True
+        time.sleep(0.025)
+    return False
+
+
 class TestModularSystem:
     """Test the complete modular system integration."""
     
-    def test_application_initialization(self):
+    def test_application_initialization(self, app):
         """Test application initializes correctly."""
-        app = ZebraPrintApplication()
-        
         assert app.api_service is not None
         assert app.printer_service is not None
         assert app.tunnel_providers is not None
@@ -22,9 +46,8 @@ class TestModularSystem:
         assert app.label_service is not None
         assert app.menu_controller is not None
     
-    def test_system_status_overview(self):
+    def test_system_status_overview(self, app):
         """Test system status provides complete overview."""
-        app = ZebraPrintApplication()
         status = app.system_status.get_overall_status()
         
         # Check required status keys
@@ -40,10 +63,8 @@ class TestModularSystem:
         assert 'ready' in status['printer']
         assert 'details' in status['printer']
     
-    def test_label_service_functionality(self):
+    def test_label_service_functionality(self, app):
         """Test label service core functionality."""
-        app = ZebraPrintApplication()
-        
         # Test sample label creation
         sample_label = app.label_service.create_sample_label("TEST")
         assert sample_label['title'].startswith("W-CPN/OUT/TEST")
@@ -63,10 +84,8 @@ class TestModularSystem:
         assert custom_label['date'] == "01/01/25"
         assert custom_label['qr_code'] == "QR123"
     
-    def test_tunnel_providers_available(self):
+    def test_tunnel_providers_available(self, app):
         """Test all tunnel providers are available."""
-        app = ZebraPrintApplication()
-        
         expected_providers = ['cloudflare', 'cloudflare_named', 'ngrok']
         for provider in expected_providers:
             assert provider in app.tunnel_providers
@@ -75,36 +94,37 @@ class TestModularSystem:
             assert hasattr(app.tunnel_providers[provider], 'stop')
     
     @pytest.mark.slow
+    @pytest.mark.serial
     def test_api_service_lifecycle(self):
         """Test API service start/stop lifecycle."""
         app = ZebraPrintApplication()
+        port = app.api_service.port
         
         # Ensure API is stopped initially
         if app.api_service.is_running():
             app.api_service.stop()
-            time.sleep(1)
+            _wait_port(port, want_open=False)
         
         assert not app.api_service.is_running()
         
         # Test start
         success, message = app.api_service.start()
         if success:  # Only test if start succeeds (may fail if port in use)
-            time.sleep(3)  # Wait for startup
+            assert _wait_port(port, want_open=True)
             assert app.api_service.is_running()
             
             # Test stop
             success, message = app.api_service.stop()
             assert success
-            time.sleep(1)
+            assert _wait_port(port, want_open=False)
             assert not app.api_service.is_running()
 
 
 class TestSystemComponents:
     """Test individual system components."""
     
-    def test_database_integration(self):
+    def test_database_integration(self, app):
         """Test database integration works."""
-        app = ZebraPrintApplication()
         db = app.system_status.db
         
         # Test system state storage
@@ -121,9 +141,8 @@ class TestSystemComponents:
         assert retrieved_state.is_configured is True
         assert retrieved_state.is_running is False
     
-    def test_printer_service_status(self):
+    def test_printer_service_status(self, app):
         """Test printer service provides status."""
-        app = ZebraPrintApplication()
         status = app.printer_service.get_status()
         
         assert 'name' in status
@@ -0,0 +1,101 @@
+"""
+Unit tests for print job batching.
+"""
+
+import threading
+import time
+import pytest
+from zebra_print.core.print_batcher import PrintBatcher
+
+
+@pytest.fixture
+def printed():
+    """Record payloads handed to the printer."""
+    return []
+
+
+@pytest.fixture
+def batcher(printed):
+    """Provide a batcher whose printer is slow enough for requests to queue up."""
+    def fake_print(zpl):
+        printed.append(zpl)
+        time.sleep(0.05)
+        return True, "Print job sent"
+
+    return PrintBatcher(fake_print)
+
+
+class TestPrintBatcher:
+    """Test coalescing of print submissions."""
+
+    def test_single_job_sent_unchanged(self, batcher, printed):
+        """Test a lone submission is printed as-is."""
+        assert batcher.submit(b"^XA^XZ") == (True, "Print job sent")
+        assert printed == [b"^XA^XZ"]
+
+    def test_concurrent_jobs_are_batched(self, batcher, printed):
+        """Test concurrent submissions share printer jobs and all get a result."""
+        results = []
+        threads = [
+            threading.Thread(target=lambda i=i: results.append(batcher.submit(f"^XA{i}^XZ".encode())))
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert results == [(True, "Print job sent")] * 8
+        assert len(printed) < 8
+        assert sorted(b"\n".join(printed).split(b"\n")) == sorted(f"^XA{i}^XZ".encode() for i in range(8))
+
+    def test_requests_within_window_batched_while_idle(self, printed):
+        """Test requests arriving a few ms apart share a job even if the printer is idle."""
+        def fast_print(zpl):
+            printed.append(zpl)
+            return True, "Print job sent"
+
+        batcher = PrintBatcher(fast_print, max_jobs=3, window=0.5)
+        threads = []
+        for i in range(3):
+            threads.append(threading.Thread(target=batcher.submit, args=(f"^XA{i}^XZ".encode(),)))
+            threads[-1].start()
+            time.sleep(0.01)
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert printed == [b"^XA0^XZ\n^XA1^XZ\n^XA2^XZ"]
+
+    def test_bad_job_fails_only_its_own_request(self):
+        """Test one malformed document in a batch doesn't fail the others."""
+        def strict_print(zpl):
+            if b"BAD" in zpl:
+                return False, "Print failed: malformed ZPL"
+            return True, "Print job sent"
+
+        batcher = PrintBatcher(strict_print, max_jobs=3, window=0.5)
+        results = {}
+        threads = [
+            threading.Thread(target=lambda zpl=zpl: results.__setitem__(zpl, batcher.submit(zpl)))
+            for zpl in (b"^XA1^XZ", b"BAD", b"^XA2^XZ")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert results == {
+            b"^XA1^XZ": (True, "Print job sent"),
+            b"BAD": (False, "Print failed: malformed ZPL"),
+            b"^XA2^XZ": (True, "Print job sent"),
+        }
+
+    def test_print_error_reported(self):
+        """Test an exception from the printer becomes an error tuple."""
+        def failing_print(zpl):
+            raise OSError("lp missing")
+
+        success, message = PrintBatcher(failing_print).submit(b"^XA^XZ")
+
+        assert success is False
+        assert "lp missing" in message
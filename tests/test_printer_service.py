@@ -0,0 +1,142 @@
+"""
+Unit tests for printer service batching.
+"""
+
+import pytest
+from zebra_print.printer import ZebraCUPSPrinter, zebra_cups
+
+
+@pytest.fixture
+def lp(fake_command):
+    """Provide a stand-in lp that saves the job it receives to lp.stdin and its arguments to lp.args."""
+    script = fake_command("lp", 'echo "$@" > "$0.args"\ncat > "$0.stdin"')
+    return script.parent
+
+
+class TestPrintZplBatch:
+    """Test sending several ZPL documents as one job."""
+
+    def test_documents_sent_as_one_job(self, fake_cups, lp):
+        """Test mixed str/bytes documents are joined into a single print."""
+        printer = ZebraCUPSPrinter("Test-Printer")
+
+        success, _ = printer.print_zpl_batch(["^XA^FDone^FS^XZ", b"^XA^FDtwo^FS^XZ"])
+
+        assert success is True
+        assert (lp / "lp.stdin").read_bytes() == b"^XA^FDone^FS^XZ\n^XA^FDtwo^FS^XZ"
+
+    def test_empty_batch_rejected(self, fake_cups, lp):
+        """Test an empty batch is reported without printing."""
+        printer = ZebraCUPSPrinter("Test-Printer")
+
+        assert printer.print_zpl_batch([]) == (False, "No ZPL documents to print")
+        assert not (lp / "lp.stdin").exists()
+
+
+class TestConnectionCheck:
+    """Test the lp connection check."""
+
+    def test_command_piped_to_lp(self, lp):
+        """Test the test command reaches lp's stdin for the configured printer."""
+        success, _ = ZebraCUPSPrinter("Test-Printer").test_connection()
+
+        assert success is True
+        assert (lp / "lp.stdin").read_text() == "^XA^HH^XZ"
+        assert (lp / "lp.args").read_text().split() == ["-d", "Test-Printer", "-o", "raw"]
+
+
+class TestPrintViaLp:
+    """Test piping ZPL to the lp command."""
+
+    def test_lp_error_reported_when_it_exits_early(self, fake_command):
+        """Test lp's own error is returned when it quits without reading a large job."""
+        fake_command("lp", 'echo "lp: The printer or class does not exist." >&2\nexit 1')
+
+        success, message = ZebraCUPSPrinter("Missing-Printer")._print_via_lp(b"^XA^XZ\n" * 30000)
+
+        assert success is False
+        assert message == "Print failed: lp: The printer or class does not exist."
+
+
+class FakeCupsServer:
+    """Minimal cupsd double: tracks created, finished and cancelled jobs."""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.printers = {}
+        self.jobs = {}
+        self.cancelled = []
+
+    def _maybe_fail(self, call):
+        if call == self.fail_on:
+            raise RuntimeError(f"{call} failed")
+
+    def getPrinters(self):
+        return self.printers
+
+    def createJob(self, printer, title, options):
+        self._maybe_fail("createJob")
+        job_id = len(self.jobs) + 1
+        self.jobs[job_id] = b""
+        self._current = job_id
+        return job_id
+
+    def startDocument(self, printer, job_id, name, fmt, last):
+        self._maybe_fail("startDocument")
+
+    def writeRequestData(self, data, length):
+        self._maybe_fail("writeRequestData")
+        self.jobs[self._current] += data
+
+    def finishDocument(self, printer):
+        self._maybe_fail("finishDocument")
+
+    def cancelJob(self, job_id):
+        self.cancelled.append(job_id)
+
+
+class TestCupsFallback:
+    """Test falling back from the pycups connection to the lp tools."""
+
+    def test_printers_listed_by_lpstat_when_cupsd_unreachable(self, fake_cups, fake_command):
+        """Test list_printers parses lpstat when cups.Connection raises."""
+        fake_command("lpstat", 'echo "printer ZTC-ZD230 is idle.  enabled since Mon"')
+
+        assert zebra_cups.list_printers() == {"ZTC-ZD230": "is idle.  enabled since Mon"}
+
+    def test_stopped_printer_state_matches_lpstat(self, fake_cups):
+        """Test CUPS printer-state 5 is reported with lpstat's wording."""
+        server = FakeCupsServer()
+        server.printers = {"ZTC-ZD230": {"printer-state": 5}}
+        fake_cups.Connection = lambda: server
+
+        assert zebra_cups.list_printers() == {"ZTC-ZD230": "is stopped."}
+
+    def test_printer_list_degrades_when_cupsd_unreachable(self, fake_cups, fake_command):
+        """Test get_printer_list returns lpstat's view instead of raising."""
+        fake_command("lpstat", 'echo "printer ZTC-ZD230 disabled since Mon -"')
+
+        assert ZebraCUPSPrinter().get_printer_list() == {"ZTC-ZD230": "disabled since Mon -"}
+
+    def test_lp_used_when_job_cannot_be_created(self, fake_cups, lp):
+        """Test a failure before createJob returns lets lp print the labels."""
+        server = FakeCupsServer(fail_on="createJob")
+        fake_cups.Connection = lambda: server
+
+        success, _ = ZebraCUPSPrinter("Test-Printer").print_zpl("^XA^XZ")
+
+        assert success is True
+        assert (lp / "lp.stdin").read_bytes() == b"^XA^XZ"
+
+    @pytest.mark.parametrize("fail_on", ["startDocument", "writeRequestData", "finishDocument"])
+    def test_created_job_cancelled_instead_of_reprinted(self, fake_cups, lp, fail_on):
+        """Test a failure after createJob cancels the job and never calls lp."""
+        server = FakeCupsServer(fail_on=fail_on)
+        fake_cups.Connection = lambda: server
+
+        success, message = ZebraCUPSPrinter("Test-Printer").print_zpl("^XA^XZ")
+
+        assert success is False
+        assert message == f"Print failed: CUPS job 1 cancelled: {fail_on} failed"
+        assert server.cancelled == [1]
+        assert not (lp / "lp.stdin").exists()
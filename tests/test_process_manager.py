@@ -0,0 +1,102 @@
+"""
+Unit tests for process management utilities.
+"""
+
+import os
+import subprocess
+import sys
+import time
+import pytest
+from zebra_print.utils.process_manager import ProcessManager
+
+
+class TestReadLogTail:
+    """Test reading the end of a process log."""
+
+    def test_returns_last_bytes(self, tmp_path):
+        """Test only the end of a large log is returned."""
+        log_file = tmp_path / "tunnel.log"
+        log_file.write_text("x" * 10000 + "ERR connection refused\n")
+
+        tail = ProcessManager.read_log_tail(str(log_file), 23)
+
+        assert tail == "ERR connection refused\n"
+
+    def test_short_log_returned_whole(self, tmp_path):
+        """Test a log shorter than the limit is returned in full."""
+        log_file = tmp_path / "tunnel.log"
+        log_file.write_text("started\n")
+
+        assert ProcessManager.read_log_tail(str(log_file)) == "started\n"
+
+
+class TestWaitForExit:
+    """Test waiting for a process to exit."""
+
+    def test_returns_when_process_exits(self):
+        """Test the wait ends as soon as the process is gone."""
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+
+        started = time.monotonic()
+        assert ProcessManager.wait_for_exit(process.pid, timeout=5) is True
+        assert time.monotonic() - started < 3
+
+    def test_times_out_on_running_process(self, running_process):
+        """Test the wait reports a process still alive after the timeout."""
+        assert ProcessManager.wait_for_exit(running_process.pid, timeout=0.2) is False
+
+    def test_exited_process_returns_at_once(self, exited_pid):
+        """Test a process that is already gone needs no polling."""
+        started = time.monotonic()
+        assert ProcessManager.wait_for_exit(exited_pid, timeout=5) is True
+        assert time.monotonic() - started < 1
+
+
+class TestTerminateProcessGroup:
+    """Test stopping a process group."""
+
+    @pytest.mark.skipif(not hasattr(os, "killpg"), reason="process groups are POSIX-only")
+    def test_returns_once_group_exits(self):
+        """Test termination does not wait out whole polling intervals."""
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"],
+                                   start_new_session=True)
+
+        started = time.monotonic()
+        assert ProcessManager.terminate_process_group(process.pid) is True
+        assert time.monotonic() - started < 0.9
+        assert process.wait(timeout=1) is not None
+
+
+class TestPidFile:
+    """Test PID file helpers."""
+
+    def test_write_then_read(self, tmp_path):
+        """Test a written PID reads back, replacing any previous content."""
+        pid_file = str(tmp_path / "api.pid")
+        (tmp_path / "api.pid").write_text("999999")
+
+        assert ProcessManager.write_pid_file(pid_file, 42) is True
+        assert ProcessManager.read_pid_file(pid_file) == 42
+
+    def test_write_to_missing_directory_fails(self, tmp_path):
+        """Test write failures are reported instead of raised."""
+        pid_file = str(tmp_path / "missing" / "api.pid")
+
+        assert ProcessManager.write_pid_file(pid_file, 42) is False
+
+    def test_read_missing_file(self, tmp_path):
+        """Test a missing PID file reads as no PID."""
+        assert ProcessManager.read_pid_file(str(tmp_path / "api.pid")) is None
+
+
+class TestReadCmdline:
+    """Test reading a process command line."""
+
+    @pytest.mark.skipif(not os.path.exists("/proc/self/cmdline"), reason="requires /proc")
+    def test_reads_own_cmdline(self):
+        """Test the current process's arguments are returned space-separated."""
+        assert "pytest" in ProcessManager.read_cmdline(os.getpid())
+
+    def test_missing_process(self):
+        """Test an unreadable PID returns None."""
+        assert ProcessManager.read_cmdline(2 ** 22 + 1) is None
@@ -0,0 +1,27 @@
+"""
+Unit tests for Server-Timing stage recording.
+"""
+
+import re
+from zebra_print.api.server_timing import StageTimer
+
+
+class TestStageTimer:
+    """Test stage timing and header formatting."""
+
+    def test_stages_recorded_in_order(self):
+        """Test each mark closes one stage with a non-negative duration."""
+        timer = StageTimer()
+        timer.mark("zpl")
+        timer.mark("print")
+
+        assert [name for name, _ in timer.stages] == ["zpl", "print"]
+        assert all(ns >= 0 for _, ns in timer.stages)
+
+    def test_header_format(self):
+        """Test the header lists stages as name;dur=milliseconds."""
+        timer = StageTimer()
+        timer.mark("zpl")
+        timer.mark("print")
+
+        assert re.fullmatch(r"zpl;dur=\d+\.\d, print;dur=\d+\.\d", timer.header())
@@ -0,0 +1,44 @@
+"""
+Unit tests for label template rendering.
+"""
+
+import pytest
+from zebra_print.templates.template_manager import TemplateManager
+
+
+class TestTemplateRendering:
+    """Test ZPL template rendering."""
+
+    def test_render_template_substitutes_fields(self, temp_db, sample_label_data):
+        """Test all placeholders are replaced with label data."""
+        manager = TemplateManager(temp_db)
+
+        success, zpl = manager.render_template("standard", sample_label_data)
+
+        assert success is True
+        assert "{{" not in zpl
+        assert "^FDLA,TEST123456^FS" in zpl
+        assert "^FDW-CPN/OUT/TEST^FS" in zpl
+
+    def test_render_multiple_labels(self, temp_db, sample_label_data):
+        """Test batch rendering emits initialization once and one block per label."""
+        manager = TemplateManager(temp_db)
+
+        success, zpl = manager.render_multiple_labels("standard", [sample_label_data] * 3)
+
+        assert success is True
+        assert zpl.count("^JUS") == 1
+        assert zpl.count("^BQN") == 3
+        assert zpl.endswith("^XZ")
+
+    def test_render_multiple_labels_missing_field(self, temp_db, sample_label_data, sample_label_factory):
+        """Test batch rendering rejects labels with missing fields."""
+        manager = TemplateManager(temp_db)
+
+        invalid_label = sample_label_factory()
+        del invalid_label['date']
+
+        success, message = manager.render_multiple_labels("standard", [sample_label_data, invalid_label])
+
+        assert success is False
+        assert "Missing required fields: ['date']" in message
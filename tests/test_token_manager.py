@@ -0,0 +1,65 @@
+"""
+Unit tests for API token management.
+"""
+
+import pytest
+from zebra_print.auth.token_manager import TokenManager, _sha256_hex
+
+
+@pytest.fixture
+def token_manager(tmp_path):
+    """Provide a token manager backed by a temporary file."""
+    return TokenManager(str(tmp_path / "api_tokens.json"))
+
+
+class TestTokenValidation:
+    """Test token validation."""
+
+    def test_generated_token_validates(self, token_manager):
+        """Test a freshly generated token is accepted and reports its name."""
+        token = token_manager.generate_token("odoo")
+
+        assert token_manager.validate_token(token) == (True, "odoo")
+        assert token_manager.get_token_info("odoo")['last_used'] is not None
+
+    def test_unknown_token_rejected(self, token_manager):
+        """Test a well-formed but unknown token is rejected."""
+        token_manager.generate_token("odoo")
+
+        assert token_manager.validate_token("zp_" + "x" * 32) == (False, None)
+
+    def test_revoked_token_rejected(self, token_manager):
+        """Test a revoked token no longer validates."""
+        token = token_manager.generate_token("odoo")
+        token_manager.revoke_token("odoo")
+
+        assert token_manager.validate_token(token) == (False, None)
+
+    def test_tokens_reloaded_from_storage(self, token_manager):
+        """Test tokens persisted by one manager validate in a new one."""
+        token = token_manager.generate_token("odoo")
+
+        reloaded = TokenManager(token_manager.storage_file)
+
+        assert reloaded.validate_token(token) == (True, "odoo")
+
+    def test_last_used_saved_once_per_interval(self, token_manager, monkeypatch):
+        """Test repeated validations don't rewrite the token file every time."""
+        token = token_manager.generate_token("odoo")
+        saves = []
+        monkeypatch.setattr(token_manager, "_save_tokens", lambda: saves.append(1))
+
+        for _ in range(5):
+            assert token_manager.validate_token(token) == (True, "odoo")
+
+        assert len(saves) == 1
+
+    def test_repeated_token_hashed_once(self, token_manager):
+        """Test the same bearer token is only hashed on first use."""
+        token = token_manager.generate_token("odoo")
+        _sha256_hex.cache_clear()
+
+        for _ in range(3):
+            token_manager.validate_token(token)
+
+        assert _sha256_hex.cache_info().misses == 1
@@ -0,0 +1,87 @@
+"""
+Unit tests for JSON to ZPL conversion.
+"""
+
+import pytest
+from zebra_print.core.zpl_generator import json_to_zpl, json_to_zpl_bytes, _label_to_zpl
+
+
+@pytest.fixture
+def print_label():
+    """Provide a label in the print API format."""
+    return {
+        "qr_code": "TEST123456",
+        "do_number": "W-CPN/OUT/TEST",
+        "route": "Route A",
+        "date": "08/08/25",
+        "customer": "Test Customer",
+        "so_number": "SO-TEST001",
+        "mo_number": "MO-TEST001",
+        "item": "Test Product",
+        "qty": "1",
+        "uom": "PCS"
+    }
+
+
+class TestJsonToZpl:
+    """Test ZPL generation from label data."""
+
+    def test_single_label(self, print_label):
+        """Test a single label produces init block, stored format and one recall."""
+        zpl = json_to_zpl({"labels": [print_label]})
+
+        assert zpl.startswith("^XA\n^JUS")
+        assert zpl.count("^XA") == 3
+        assert "^FN1^FDLA,TEST123456^FS" in zpl
+        assert "^FN3^FDRoute A 08/08/25^FS" in zpl
+        assert zpl.endswith("^XZ")
+
+    def test_format_stored_once_per_job(self, print_label):
+        """Test the label layout is downloaded once and recalled per label."""
+        zpl = json_to_zpl({"labels": [print_label] * 3})
+
+        assert zpl.count("^DFR:LABEL.ZPL") == 1
+        assert zpl.count("^XFR:LABEL.ZPL") == 3
+        assert zpl.count("^BQN") == 1
+        assert zpl.count("^LL236") == 1
+
+    def test_labels_separated_by_blank_line(self, print_label):
+        """Test consecutive labels are separated by a blank line."""
+        zpl = json_to_zpl({"labels": [print_label, print_label]})
+
+        assert zpl.count("^XFR:LABEL.ZPL") == 2
+        assert "^XZ\n\n^XA" in zpl
+
+    def test_repeated_labels_use_cache(self, print_label):
+        """Test identical labels are rendered once and served from cache."""
+        _label_to_zpl.cache_clear()
+
+        json_to_zpl({"labels": [print_label] * 5})
+
+        info = _label_to_zpl.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+
+    def test_missing_field_raises(self, print_label):
+        """Test missing label fields are reported as KeyError."""
+        del print_label['uom']
+
+        with pytest.raises(KeyError):
+            json_to_zpl({"labels": [print_label]})
+
+    def test_bytes_output_matches_text(self, print_label):
+        """Test the bytes builder produces the encoded text output."""
+        for count in (0, 1, 3):
+            label_data = {"labels": [print_label] * count}
+
+            assert json_to_zpl_bytes(label_data) == json_to_zpl(label_data).encode('utf-8')
+
+    def test_non_string_and_percent_values(self, print_label):
+        """Test numeric values are stringified and '%' in data is printed literally."""
+        print_label['qty'] = 12
+        print_label['item'] = "50% Cotton"
+
+        zpl = json_to_zpl({"labels": [print_label]})
+
+        assert "^FN7^FD12 PCS^FS" in zpl
+        assert "^FN6^FD50% Cotton^FS" in zpl
@@ -3,8 +3,24 @@ API components module.
 Contains API service and client implementations.
 """
 
+from importlib import import_module
+
 from .base import APIService, APIClient
-from .flask_service import FlaskAPIService
-from .http_client import HTTPAPIClient
 
-__all__ = ['APIService', 'APIClient', 'FlaskAPIService', 'HTTPAPIClient']
\ No newline at end of file
+# Implementations import requests; load them on first access rather than
+# with the package, so importing e.g. zebra_print.api.base stays cheap
+_LAZY_EXPORTS = {
+    'FlaskAPIService': '.flask_service',
+    'HTTPAPIClient': '.http_client',
+}
+
+__all__ = ['APIService', 'APIClient', 'FlaskAPIService', 'HTTPAPIClient']
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -5,12 +5,46 @@ Manages the Flask server for handling label print requests.
 
 import os
 import signal
+import socket
 import subprocess
+import sys
+import threading
 import time
 import requests
 import tempfile
-from typing import Dict, Tuple
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Tuple
 from zebra_print.api.base import APIService
+from zebra_print.utils.process_manager import ProcessManager
+
+# Seconds a health check result is reused, so repeated status calls share a
+# single HTTP round trip. A failure is kept for less time than a success so a
+# server that is just coming up is noticed quickly; stop() clears the cache.
+HEALTH_CACHE_TTL = 5.0
+HEALTH_FAILURE_CACHE_TTL = 1.0
+
+# Seconds a get_status() result is reused while the PID file is unchanged
+STATUS_CACHE_TTL = 1.0
+
+# Seconds to wait for a TCP connect when only checking that the port is served.
+# The server is local, so a connect either completes or is refused at once;
+# the timeout only bounds a filtered or unreachable host.
+PORT_CHECK_TIMEOUT = 0.2
+
+# Per-request timeout while waiting for a freshly started server; the wait
+# loop retries, so a probe that hangs should not hold it for long
+READY_PROBE_TIMEOUT = 0.3
+
+# The platform cannot change while we run, so check it once
+IS_WINDOWS = sys.platform == "win32"
+
+# Popen options that detach the server from our console/session
+if IS_WINDOWS:
+    _POPEN_KWARGS = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    # start_new_session rather than preexec_fn=os.setsid lets CPython spawn
+    # via vfork instead of copying our heap
+    _POPEN_KWARGS = {'start_new_session': True}
 
 class FlaskAPIService(APIService):
     """Flask-based API service implementation."""
@@ -19,34 +53,65 @@ class FlaskAPIService(APIService):
         self.port = port
         self.host = host
         
+        # Address clients use to reach the server; localhost when it binds to 0.0.0.0
+        self._client_host = "localhost" if host == "0.0.0.0" else host
+        self._base_url = f"http://{self._client_host}:{port}"
+        self._health_url = f"{self._base_url}/health"
+        
         # Use cross-platform temp directory
         temp_dir = tempfile.gettempdir()
         self.pid_file = os.path.join(temp_dir, f"flask_api_{port}.pid")
         
+        # Server console output goes to a file; a pipe nobody drains would
+        # block the server once its buffer fills
+        self.log_file = os.path.join(temp_dir, f"flask_api_{port}.log")
+        
         # Set script path dynamically
         current_file = os.path.abspath(__file__)
         # From zebra_print/api/flask_service.py go up 3 levels to project root
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
         self.script_path = os.path.join(project_root, "label_print_api.py")
+        
+        # Server command line (python instead of python3 on Windows)
+        self._start_cmd = ['python' if IS_WINDOWS else 'python3', self.script_path]
+        
+        # (monotonic timestamp, result) of the last health check
+        self._health_cache = (0.0, False)
+        self._health_lock = threading.Lock()
+        
+        # Keep-alive session for health probes, so repeated checks reuse the
+        # local TCP connection; retries are left to the callers' own loops
+        self._session = requests.Session()
+        self._session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0))
+        
+        # (PID file mtime, pid) of the last PID file read
+        self._pid_cache = None
+        
+        # (monotonic timestamp, PID file mtime, status) of the last get_status()
+        self._status_cache = (0.0, None, None)
     
     def is_running(self) -> bool:
-        """Check if API service is running (PID file or HTTP response)."""
-        # Method 1: Check PID file (for manually started instances)
-        if os.path.exists(self.pid_file):
-            try:
-                with open(self.pid_file, 'r') as f:
-                    pid = int(f.read().strip())
-                
-                # Check if process is still running
-                os.kill(pid, 0)
-                return True
-                
-            except (OSError, ProcessLookupError, ValueError):
-                # Clean up stale PID file
-                os.remove(self.pid_file)
+        """Check if API service is running (PID file or open API port)."""
+        # Method 1: Check PID file (for manually started instances). The stat in
+        # _read_pid doubles as the existence check.
+        try:
+            pid = self._read_pid()
+            
+            # Check if process is still running
+            os.kill(pid, 0)
+            return True
+            
+        except FileNotFoundError:
+            pass
+        except (OSError, ProcessLookupError, ValueError):
+            # Clean up stale PID file
+            os.remove(self.pid_file)
+            self._pid_cache = None
         
-        # Method 2: Check if API is responding (for supervisor/Docker instances)
-        return self._health_check()
+        # Method 2: Check if the API port accepts connections (for supervisor/Docker
+        # instances). A bare TCP connect is enough to tell it is up; the full
+        # /health request is left to get_status().
+        return self._port_open()
     
     def start(self) -> Tuple[bool, str]:
         """Start the API service."""
@@ -58,48 +123,36 @@ class FlaskAPIService(APIService):
                 return False, f"API script not found: {self.script_path}"
             
             # Start Flask server in background
-            import platform
-            if platform.system() == "Windows":
-                # Use python instead of python3 on Windows
-                cmd = ['python', self.script_path]
-                process = subprocess.Popen(cmd, stdout=subprocess.PIPE, 
-                                         stderr=subprocess.PIPE, 
-                                         creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
-            else:
-                # Unix/Linux
-                cmd = ['python3', self.script_path]
-                process = subprocess.Popen(cmd, stdout=subprocess.PIPE, 
-                                         stderr=subprocess.PIPE, preexec_fn=os.setsid)
+            with open(self.log_file, 'w') as log:
+                process = subprocess.Popen(self._start_cmd, stdout=log, 
+                                         stderr=subprocess.STDOUT, **_POPEN_KWARGS)
             
             # Save PID
-            with open(self.pid_file, 'w') as f:
-                f.write(str(process.pid))
+            self._pid_cache = None
+            if not ProcessManager.write_pid_file(self.pid_file, process.pid):
+                return False, f"API server started (PID {process.pid}) but PID file could not be written: {self.pid_file}"
             
             # Wait for server to start (increased timeout for Windows)
-            import platform
-            wait_time = 5 if platform.system() == "Windows" else 3
-            time.sleep(min(wait_time, 2))  # Cap wait time at 2 seconds
+            wait_time = 5 if IS_WINDOWS else 3
             
             # Verify server is responding
-            health_result = self._health_check()
+            health_result = self._wait_until_ready(process, wait_time)
             if health_result:
                 return True, f"API server started on {self.host}:{self.port}"
             else:
                 # Check if process is still running
                 if self.is_running():
                     # Try to get more info about why health check failed
-                    check_host = "localhost" if self.host == "0.0.0.0" else self.host
-                    return False, f"API server started but not responding to health check at {check_host}:{self.port}. Check Windows Firewall or try different port."
+                    return False, f"API server started but not responding to health check at {self._client_host}:{self.port}. Check Windows Firewall or try different port."
                 else:
-                    # Process died, check stderr for error
+                    # Process died, check its log for the error
                     try:
-                        stderr_output = process.stderr.read().decode().strip() if process.stderr else ""
-                        stdout_output = process.stdout.read().decode().strip() if process.stdout else ""
+                        output = ProcessManager.read_log_tail(self.log_file).strip()
                         
-                        if "Port" in stderr_output and "in use" in stderr_output:
+                        if "Port" in output and "in use" in output:
                             return False, f"Port {self.port} is already in use by another process"
-                        elif stderr_output or stdout_output:
-                            return False, f"API server process died. Error: {stderr_output}. Output: {stdout_output[:200]}"
+                        elif output:
+                            return False, f"API server process died. Output: {output}"
                         else:
                             return False, "API server process died unexpectedly (no error output)"
                     except Exception as e:
@@ -111,22 +164,21 @@ class FlaskAPIService(APIService):
     def stop(self) -> Tuple[bool, str]:
         """Stop the API service."""
         try:
-            if not os.path.exists(self.pid_file):
+            try:
+                pid = self._read_pid()
+            except FileNotFoundError:
                 return True, "API server not running"
             
-            with open(self.pid_file, 'r') as f:
-                pid = int(f.read().strip())
-            
             # Cross-platform process termination
-            import platform
-            if platform.system() == "Windows":
+            if IS_WINDOWS:
                 # Windows process termination
                 try:
                     import psutil
                     process = psutil.Process(pid)
                     process.terminate()
-                    time.sleep(2)
-                    if process.is_running():
+                    try:
+                        process.wait(timeout=2)
+                    except psutil.TimeoutExpired:
                         process.kill()
                 except ImportError:
                     # Fallback if psutil not available
@@ -138,24 +190,31 @@ class FlaskAPIService(APIService):
                 # Unix/Linux process termination
                 try:
                     os.killpg(os.getpgid(pid), signal.SIGTERM)
-                    time.sleep(2)
                     # Force kill if still running
-                    try:
-                        os.killpg(os.getpgid(pid), signal.SIGKILL)
-                    except:
-                        pass
+                    if not ProcessManager.wait_for_exit(pid, timeout=2):
+                        try:
+                            os.killpg(os.getpgid(pid), signal.SIGKILL)
+                        except:
+                            pass
                 except:
                     # Fallback to simple kill
                     try:
                         os.kill(pid, signal.SIGTERM)
-                        time.sleep(2)
-                        os.kill(pid, signal.SIGKILL)
+                        if not ProcessManager.wait_for_exit(pid, timeout=2):
+                            os.kill(pid, signal.SIGKILL)
                     except:
                         pass
             
             # Remove PID file
-            if os.path.exists(self.pid_file):
+            try:
                 os.remove(self.pid_file)
+            except FileNotFoundError:
+                pass
+            self._pid_cache = None
+            
+            # Don't report the stopped server as healthy from cache
+            self._health_cache = (0.0, False)
+            self._status_cache = (0.0, None, None)
             
             return True, "API server stopped"
             
@@ -163,50 +222,128 @@ class FlaskAPIService(APIService):
             return False, f"Failed to stop API server: {str(e)}"
     
     def get_status(self) -> Dict[str, any]:
-        """Get API service status."""
-        # Use localhost for client connections when server binds to 0.0.0.0
-        client_host = "localhost" if self.host == "0.0.0.0" else self.host
+        """Get API service status.
+        
+        A status younger than STATUS_CACHE_TTL is returned again (as a copy)
+        as long as the PID file has not been written or removed since.
+        """
+        pid_key = self._pid_file_key()
+        checked_at, cached_key, cached = self._status_cache
+        if cached is not None and cached_key == pid_key and time.monotonic() - checked_at < STATUS_CACHE_TTL:
+            return dict(cached)
         
         status = {
             'running': self.is_running(),
-            'host': client_host,
+            'host': self._client_host,
             'port': self.port,
             'pid': None,
             'health': False,
-            'url': f"http://{client_host}:{self.port}"
+            'url': self._base_url
         }
         
-        if os.path.exists(self.pid_file):
-            try:
-                with open(self.pid_file, 'r') as f:
-                    status['pid'] = int(f.read().strip())
-            except:
-                pass
+        try:
+            status['pid'] = self._read_pid()
+        except (OSError, ValueError):
+            pass
         
         if status['running']:
             status['health'] = self._health_check()
         
-        return status
+        self._status_cache = (time.monotonic(), pid_key, status)
+        return dict(status)
     
-    def _health_check(self) -> bool:
-        """Perform internal health check."""
+    def _pid_file_key(self) -> Optional[Tuple[int, int, int]]:
+        """Return the PID file's (inode, size, mtime), or None if there is no PID file.
+        
+        The inode and size catch a restart rewriting the file within one tick
+        of a filesystem with coarse timestamps.
+        """
         try:
-            # Use localhost for health check when server binds to 0.0.0.0
-            check_host = "localhost" if self.host == "0.0.0.0" else self.host
-            health_url = f"http://{check_host}:{self.port}/health"
+            st = os.stat(self.pid_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+    
+    def close(self):
+        """Close the health check HTTP session."""
+        self._session.close()
+    
+    def _read_pid(self) -> int:
+        """Read the PID file, reusing the last value while the file is unchanged."""
+        key = self._pid_file_key()
+        if key is None:
+            raise FileNotFoundError(self.pid_file)
+        if self._pid_cache and self._pid_cache[0] == key:
+            return self._pid_cache[1]
+        
+        with open(self.pid_file, 'r') as f:
+            pid = int(f.read().strip())
+        
+        self._pid_cache = (key, pid)
+        return pid
+    
+    def _health_check(self, ttl: Optional[float] = None) -> bool:
+        """Perform internal health check, reusing a result younger than ttl seconds.
+        
+        ttl defaults to HEALTH_CACHE_TTL or HEALTH_FAILURE_CACHE_TTL depending on
+        the cached result. Concurrent callers wait for one probe instead of each
+        sending their own.
+        """
+        with self._health_lock:
+            checked_at, healthy = self._health_cache
+            if ttl is None:
+                ttl = HEALTH_CACHE_TTL if healthy else HEALTH_FAILURE_CACHE_TTL
+            if checked_at and time.monotonic() - checked_at < ttl:
+                return healthy
+            
+            healthy = self._probe_health()
+            self._health_cache = (time.monotonic(), healthy)
+            return healthy
+    
+    def _wait_until_ready(self, process: subprocess.Popen, timeout: float) -> bool:
+        """Poll /health with exponential backoff until it answers or timeout expires.
+        
+        Returns as soon as the server responds, and early if the process exits.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        
+        while True:
+            healthy = self._probe_health(attempts=1, timeout=READY_PROBE_TIMEOUT)
+            self._health_cache = (time.monotonic(), healthy)
+            if healthy or process.poll() is not None:
+                return healthy
             
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.5)
+    
+    def _port_open(self, timeout: float = PORT_CHECK_TIMEOUT) -> bool:
+        """Check whether something is accepting connections on the API port."""
+        try:
+            with socket.create_connection((self._client_host, self.port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+    
+    def _probe_health(self, attempts: int = 2, timeout: float = 2) -> bool:
+        """Query the /health endpoint."""
+        try:
             # Try multiple times with shorter delays for faster response
-            for attempt in range(2):  # Reduced from 3 to 2 attempts
+            for attempt in range(attempts):
                 try:
-                    response = requests.get(health_url, timeout=2)
+                    # Connecting to the local server needs no more than the port check
+                    response = self._session.get(self._health_url, timeout=(PORT_CHECK_TIMEOUT, timeout))
                     if response.status_code == 200:
                         return True
                 except requests.exceptions.ConnectionError:
-                    if attempt < 1:  # Only retry once
+                    if attempt < attempts - 1:
                         time.sleep(0.3)  # Shorter delay
                         continue
                 except requests.exceptions.Timeout:
-                    if attempt < 1:  # Only retry once
+                    if attempt < attempts - 1:
                         time.sleep(0.3)  # Shorter delay
                         continue
                     
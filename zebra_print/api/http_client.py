@@ -5,31 +5,132 @@ Handles HTTP requests to the label printing API.
 
 import requests
 import json
+import threading
+import time
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Tuple
+from urllib3.util.retry import Retry
 from zebra_print.api.base import APIClient
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Base headers for JSON requests, shared instead of rebuilt per call
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Retry failed connects briefly. urllib3 only re-sends idempotent requests
+# after a read error, so a print POST that reached the server is not repeated.
+CONNECT_RETRY = Retry(total=2, backoff_factor=0.1)
+
+# Seconds allowed for the TCP connect alone; the client timeout then only
+# bounds the wait for a response. Short enough that a down endpoint fails
+# fast, long enough for a tunnel URL across the internet.
+CONNECT_TIMEOUT = 3.05
+
+# Seconds a health check result is reused per URL. Failures expire sooner
+# so a service that has just come up is seen promptly.
+HEALTH_CACHE_TTL = 5.0
+HEALTH_FAILURE_CACHE_TTL = 1.0
+
+
+def _encode_json(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _decode_json(content: bytes):
+    """Parse a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _body_preview(response, limit: int) -> str:
+    """Decode only the first limit bytes of a response body for error details.
+    
+    Avoids response.text, which decodes (and may charset-sniff) the whole body
+    just to keep a short prefix.
+    """
+    return response.content[:limit].decode('utf-8', errors='replace')
+
+
 class HTTPAPIClient(APIClient):
     """HTTP-based API client implementation."""
     
     def __init__(self, timeout: int = 30):
         self.timeout = timeout
         self.session = requests.Session()
+        
+        # Keep-alive pool shared by the health check and print request
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=CONNECT_RETRY)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # url -> (monotonic timestamp, result) of the last health check
+        self._health_cache: Dict[str, Tuple[float, Tuple[bool, Optional[Dict]]]] = {}
+        # url -> lock held while that URL is being checked
+        self._health_url_locks: Dict[str, threading.Lock] = {}
+        # Guards the two dicts above; never held during a request
+        self._health_lock = threading.Lock()
+    
+    def health_check(self, url: str, ttl: Optional[float] = None) -> Tuple[bool, Optional[Dict]]:
+        """Perform health check on API endpoint, reusing a result younger than ttl seconds.
+        
+        ttl defaults to HEALTH_CACHE_TTL or HEALTH_FAILURE_CACHE_TTL depending on
+        the cached result; ttl=0 always sends a request. Concurrent checks of
+        the same URL share one request; other URLs are not held up by it.
+        """
+        result = self._cached_health(url, ttl)
+        if result is not None:
+            return result
+        
+        with self._health_url_lock(url):
+            # Another caller may have refreshed this URL while we waited
+            result = self._cached_health(url, ttl)
+            if result is not None:
+                return result
+            
+            result = self._request_health(url)
+            with self._health_lock:
+                self._health_cache[url] = (time.monotonic(), result)
+            return result
+    
+    def _cached_health(self, url: str, ttl: Optional[float]) -> Optional[Tuple[bool, Optional[Dict]]]:
+        """Return the cached result for url if it is younger than ttl, else None."""
+        with self._health_lock:
+            cached = self._health_cache.get(url)
+        if not cached:
+            return None
+        
+        checked_at, result = cached
+        if ttl is None:
+            ttl = HEALTH_CACHE_TTL if result[0] else HEALTH_FAILURE_CACHE_TTL
+        return result if time.monotonic() - checked_at < ttl else None
+    
+    def _health_url_lock(self, url: str) -> threading.Lock:
+        """Return the lock serializing health requests to url."""
+        with self._health_lock:
+            return self._health_url_locks.setdefault(url, threading.Lock())
     
-    def health_check(self, url: str) -> Tuple[bool, Optional[Dict]]:
-        """Perform health check on API endpoint."""
+    def _request_health(self, url: str) -> Tuple[bool, Optional[Dict]]:
+        """Send the health check request."""
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(url, timeout=(CONNECT_TIMEOUT, self.timeout))
             
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = _decode_json(response.content)
                     return True, data
                 except:
                     return True, {'status': 'ok', 'raw_response': response.text}
             else:
                 return False, {
                     'error': f"HTTP {response.status_code}",
-                    'response': response.text[:200]
+                    'response': _body_preview(response, 200)
                 }
                 
         except requests.exceptions.Timeout:
@@ -43,27 +144,25 @@ class HTTPAPIClient(APIClient):
         """Send print request to API endpoint."""
         try:
             # Prepare headers
-            request_headers = {'Content-Type': 'application/json'}
-            if headers:
-                request_headers.update(headers)
+            request_headers = {**JSON_HEADERS, **headers} if headers else JSON_HEADERS
             
-            # Prepare payload
-            payload = {'labels': labels}
+            # Prepare payload as compact UTF-8 bytes so requests sends it as-is
+            payload = _encode_json({'labels': labels})
             
             # Send request
             response = self.session.post(
                 url,
-                data=json.dumps(payload),
+                data=payload,
                 headers=request_headers,
-                timeout=self.timeout
+                timeout=(CONNECT_TIMEOUT, self.timeout)
             )
             
             # Parse response
             response_data = None
             try:
-                response_data = response.json()
+                response_data = _decode_json(response.content)
             except:
-                response_data = {'raw_response': response.text[:500]}
+                response_data = {'raw_response': _body_preview(response, 500)}
             
             if response.status_code == 200:
                 return True, "Labels printed successfully", response_data
@@ -0,0 +1,43 @@
+"""
+Fast JSON handling for the Flask API.
+Serializes and parses request/response bodies with orjson when it is installed.
+"""
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson rejects non-str dict keys unless told otherwise; stdlib json allows them
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    orjson encodes straight to bytes, so responses skip the str round-trip
+    of the stdlib provider. Types orjson does not handle natively go
+    through Flask's default() hook as before.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS),
+            mimetype=self.mimetype
+        )
+
+
+def install_json_provider(app) -> None:
+    """Use orjson for the app's JSON if available; otherwise keep Flask's default."""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
@@ -0,0 +1,28 @@
+"""
+Server-Timing header support for the API servers.
+Reports how long each stage of a request took, visible in browser
+DevTools or with `curl -D -`.
+"""
+
+import time
+from typing import List, Tuple
+
+
+class StageTimer:
+    """Records consecutive request stages as (name, duration in ns)."""
+
+    __slots__ = ('_mark', 'stages')
+
+    def __init__(self):
+        self._mark = time.perf_counter_ns()
+        self.stages: List[Tuple[str, int]] = []
+
+    def mark(self, name: str) -> None:
+        """Close the current stage under name and start the next one."""
+        now = time.perf_counter_ns()
+        self.stages.append((name, now - self._mark))
+        self._mark = now
+
+    def header(self) -> str:
+        """Format the recorded stages as a Server-Timing header value."""
+        return ', '.join(f'{name};dur={ns / 1e6:.1f}' for name, ns in self.stages)
@@ -8,6 +8,10 @@ from functools import wraps
 from flask import request, jsonify, g
 from typing import Optional, Tuple
 
+# Authorization header scheme for API tokens
+BEARER_PREFIX = 'Bearer '
+BEARER_PREFIX_LEN = len(BEARER_PREFIX)
+
 
 class AuthMiddleware:
     """Flask authentication middleware for API token validation."""
@@ -63,19 +67,20 @@ class AuthMiddleware:
         """Extract token from Authorization header, query params, or request body."""
         # 1. Check Authorization header (Bearer token)
         auth_header = request.headers.get('Authorization')
-        if auth_header and auth_header.startswith('Bearer '):
-            return auth_header[7:]  # Remove 'Bearer ' prefix
+        if auth_header and auth_header[:BEARER_PREFIX_LEN] == BEARER_PREFIX:
+            return auth_header[BEARER_PREFIX_LEN:]  # Remove 'Bearer ' prefix
         
         # 2. Check query parameter
         token = request.args.get('token')
         if token:
             return token
         
-        # 3. Check request body (JSON)
+        # 3. Check request body (JSON). Flask caches the parsed body, so the
+        # view's own get_json() does not parse it again.
         if request.is_json:
-            data = request.get_json()
-            if data and 'token' in data:
-                return data['token']
+            data = request.get_json(silent=True)
+            if isinstance(data, dict):
+                return data.get('token')
         
         return None
     
@@ -3,13 +3,29 @@ Token Manager for Zebra Print API authentication.
 Handles token generation, validation, storage, and management.
 """
 
+import hashlib
 import json
 import secrets
-import string
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 import os
 
+# Minimum seconds between persisting a token's last_used timestamp. Saving
+# rewrites the whole token file, so it is not done on every request.
+LAST_USED_SAVE_INTERVAL = 30.0
+
+# Prefix marking Zebra Print API tokens
+TOKEN_PREFIX = "zp_"
+
+
+@lru_cache(maxsize=2048)
+def _sha256_hex(token: str) -> str:
+    """SHA-256 hex digest of a token. Clients resend the same bearer token
+    on every request, so repeat lookups are served from cache."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
 
 class TokenManager:
     """Manages API tokens for authentication."""
@@ -17,6 +33,7 @@ class TokenManager:
     def __init__(self, storage_file: str = '/app/data/api_tokens.json'):
         """Initialize token manager with storage file."""
         self.storage_file = storage_file
+        self._last_used_saved_at = {}  # name -> monotonic time last_used was persisted
         self._ensure_storage_dir()
         self._load_tokens()
     
@@ -34,6 +51,11 @@ class TokenManager:
                 self.tokens = {}
         except Exception:
             self.tokens = {}
+        
+        # token_hash -> name, so validation is a dict lookup instead of a scan
+        self._names_by_hash = {
+            token_data['token_hash']: name for name, token_data in self.tokens.items()
+        }
     
     def _save_tokens(self):
         """Save tokens to storage file."""
@@ -45,9 +67,8 @@ class TokenManager:
     
     def _generate_token_value(self) -> str:
         """Generate a secure random token."""
-        alphabet = string.ascii_letters + string.digits
-        token_part = ''.join(secrets.choice(alphabet) for _ in range(32))
-        return f"zp_{token_part}"
+        # 24 random bytes -> 32 URL-safe characters in one call
+        return TOKEN_PREFIX + secrets.token_urlsafe(24)
     
     def generate_token(self, name: str, description: str = None) -> str:
         """Generate a new API token."""
@@ -65,18 +86,18 @@ class TokenManager:
         }
         
         self.tokens[name] = token_data
+        self._names_by_hash[token_data['token_hash']] = name
         self._save_tokens()
         
         return token_value
     
     def _hash_token(self, token: str) -> str:
         """Hash token for secure storage."""
-        import hashlib
-        return hashlib.sha256(token.encode()).hexdigest()
+        return _sha256_hex(token)
     
     def validate_token(self, token: str) -> Tuple[bool, Optional[str]]:
         """Validate a token and return (is_valid, token_name)."""
-        if not token or not token.startswith('zp_'):
+        if not token or not token.startswith(TOKEN_PREFIX):
             return False, None
         
         # Check system token from environment first
@@ -86,17 +107,23 @@ class TokenManager:
         
         token_hash = self._hash_token(token)
         
-        for name, token_data in self.tokens.items():
-            if (token_data['token_hash'] == token_hash and 
-                token_data['is_active']):
-                
-                # Update last used timestamp
-                token_data['last_used'] = datetime.now().isoformat()
-                self._save_tokens()
-                
-                return True, name
+        name = self._names_by_hash.get(token_hash)
+        if name is None:
+            return False, None
+        
+        token_data = self.tokens[name]
+        if not token_data['is_active']:
+            return False, None
+        
+        # Update last used timestamp (kept in memory, persisted at most once per interval)
+        token_data['last_used'] = datetime.now().isoformat()
+        now = time.monotonic()
+        last_saved = self._last_used_saved_at.get(name)
+        if last_saved is None or now - last_saved >= LAST_USED_SAVE_INTERVAL:
+            self._save_tokens()
+            self._last_used_saved_at[name] = now
         
-        return False, None
+        return True, name
     
     def revoke_token(self, name: str) -> bool:
         """Revoke a token by name."""
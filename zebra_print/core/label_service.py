@@ -6,6 +6,7 @@ Handles label data processing and printing operations.
 from typing import Dict, List, Tuple
 from datetime import datetime
 from zebra_print.api.base import APIClient
+from zebra_print.core.zpl_generator import LABEL_FIELDS, REQUIRED_LABEL_FIELDS
 
 class LabelService:
     """Core service for label printing operations."""
@@ -15,11 +16,13 @@ class LabelService:
     
     def create_sample_label(self, prefix: str = "TEST") -> Dict:
         """Create a sample label for testing."""
+        now = datetime.now()
+        # Format from the datetime fields directly; strftime dominated this call
         return {
-            "qr_code": f"{prefix}{datetime.now().strftime('%H%M%S')}",
+            "qr_code": f"{prefix}{now.hour:02d}{now.minute:02d}{now.second:02d}",
             "do_number": f"W-CPN/OUT/{prefix}",
             "route": f"Route-{prefix}",
-            "date": datetime.now().strftime("%d/%m/%y"),
+            "date": f"{now.day:02d}/{now.month:02d}/{now.year % 100:02d}",
             "customer": f"Customer {prefix}",
             "so_number": f"SO-{prefix}-001",
             "mo_number": f"MO-{prefix}-001",
@@ -38,12 +41,15 @@ class LabelService:
     
     def validate_label_data(self, label: Dict) -> Tuple[bool, str]:
         """Validate label data structure."""
-        required_fields = ['qr_code', 'do_number', 'route', 'date', 'customer', 'so_number', 'mo_number', 'item', 'qty', 'uom']
+        # One set difference finds any missing fields; report the first in field order
+        missing = REQUIRED_LABEL_FIELDS - label.keys()
+        if missing:
+            field = next(f for f in LABEL_FIELDS if f in missing)
+            return False, f"Missing required field: {field}"
         
-        for field in required_fields:
-            if field not in label:
-                return False, f"Missing required field: {field}"
-            if not label[field] or not isinstance(label[field], str):
+        for field in LABEL_FIELDS:
+            value = label[field]
+            if not value or not isinstance(value, str):
                 return False, f"Invalid value for field: {field}"
         
         return True, "Valid"
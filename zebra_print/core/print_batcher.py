@@ -0,0 +1,88 @@
+"""
+Print job batching for the API servers.
+Coalesces ZPL from concurrent print requests into a single printer submission.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds to keep collecting requests after the first one arrives
+BATCH_WINDOW = 0.02
+
+
+class _PendingJob:
+    """A submitted ZPL payload waiting for the printer result."""
+
+    __slots__ = ('zpl', 'done', 'result')
+
+    def __init__(self, zpl: bytes):
+        self.zpl = zpl
+        self.done = threading.Event()
+        self.result = (False, "Print job was not processed")
+
+
+class PrintBatcher:
+    """
+    Sends ZPL from concurrent requests to the printer in as few jobs as possible.
+
+    A single worker thread owns the printer. When a request arrives it keeps
+    collecting others for up to window seconds (or until max_jobs), then
+    sends them as one payload, so spawning lp and the CUPS submission are
+    paid per batch rather than per request. If a batch fails, its requests
+    are sent again one at a time so each gets the result of its own ZPL.
+    """
+
+    def __init__(self, print_func: Callable[[bytes], Tuple[bool, str]], max_jobs: int = 32,
+                 window: float = BATCH_WINDOW):
+        self._print_func = print_func
+        self._max_jobs = max_jobs
+        self._window = window
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="print-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, zpl: bytes) -> Tuple[bool, str]:
+        """Queue ZPL for printing and block until its batch has been sent."""
+        job = _PendingJob(zpl)
+        self._queue.put(job)
+        job.done.wait()
+        return job.result
+
+    def _run(self):
+        """Worker loop: collect a batch of jobs, print once, hand out the results."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._window
+            while len(batch) < self._max_jobs:
+                try:
+                    batch.append(self._queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+
+            if len(batch) > 1:
+                logger.info(f"[BATCH] Sending {len(batch)} print requests as one job")
+
+            result = self._print(b"\n".join(job.zpl for job in batch))
+            if not result[0] and len(batch) > 1:
+                # Don't fail every request for one bad document: retry singly
+                logger.warning(f"[BATCH] Batch of {len(batch)} failed, resending one at a time")
+                for job in batch:
+                    job.result = self._print(job.zpl)
+                    job.done.set()
+                continue
+
+            for job in batch:
+                job.result = result
+                job.done.set()
+
+    def _print(self, zpl: bytes) -> Tuple[bool, str]:
+        """Call the print function, turning exceptions into an error tuple."""
+        try:
+            return self._print_func(zpl)
+        except Exception as e:
+            return (False, f"Print system error: {e}")
@@ -0,0 +1,161 @@
+"""
+ZPL generation for label print requests.
+Converts JSON label data into ZPL commands for the Zebra printer.
+"""
+
+import logging
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# Printer initialization (once at the beginning)
+PRINTER_INIT_COMMANDS = [
+    "^XA",
+    "^JUS",      # Auto-detect label length
+    "^MMT",      # Set media type to thermal transfer
+    "^MNY",      # Set continuous media
+    "^MTT",      # Set media type to thermal transfer
+    "^PON",      # Print orientation normal
+    "^PMN",      # Print mode normal
+    "^LRN",      # Label reverse normal
+    "^CI0",      # Change international font/encoding
+    "^XZ",
+    ""           # Blank line separator
+]
+
+# Stored label format, downloaded to printer RAM once per job. Each label
+# then only recalls it with ^XF and fills the ^FN fields, instead of
+# re-sending the calibration commands and layout for every label.
+LABEL_FORMAT_NAME = "R:LABEL.ZPL"
+
+LABEL_FORMAT_COMMANDS = [
+    "^XA",
+    f"^DF{LABEL_FORMAT_NAME}^FS",  # Store format
+
+    # CALIBRATION AND POSITIONING COMMANDS
+    "^LL236",        # Set label length to 236 dots (30mm)
+    "^PW394",        # Set print width to 394 dots (50mm)
+    "^LH0,0",        # Set label home position (top-left)
+    "^LT8",          # Set label top margin to 8 dots (reduced from 20)
+    "^PR2",          # Set print speed to 2 inches/second (slower for accuracy)
+    "^MD5",          # Set media darkness to 5 (medium)
+    "^JMA",          # Set media type to auto-detect
+
+    # QR code only (no text) - repositioned to (25,40)
+    "^FO25,40^BQN,2,5^FN1^FS",
+
+    # TEXT FIELDS WITH NEW LAYOUT - 18x18 SIZE (9 fields, no qr_code text)
+    "^FO180,50^A0N,18,18^FN2^FS",      # DO Number
+    "^FO180,75^A0N,18,18^FN3^FS",      # Route + Date
+    "^FO180,100^A0N,18,18^FN4^FS",     # Customer
+    "^FO180,125^A0N,18,18^FN5^FS",     # SO + MO Number
+    "^FO180,150^A0N,18,18^FN6^FS",     # Item
+    "^FO180,175^A0N,18,18^FN7^FS",     # Qty + UOM
+
+    "^XZ",
+    ""           # Blank line separator
+]
+
+# Encoding used when ZPL is handed to the printer as bytes
+ZPL_ENCODING = 'utf-8'
+
+# Init block and stored format, sent once at the start of every job
+ZPL_HEADER = "\n".join(PRINTER_INIT_COMMANDS + LABEL_FORMAT_COMMANDS)
+ZPL_HEADER_BYTES = ZPL_HEADER.encode(ZPL_ENCODING)
+
+# Label fields in the order _label_to_zpl expects them
+LABEL_FIELDS = ('qr_code', 'do_number', 'route', 'date', 'customer',
+                'so_number', 'mo_number', 'item', 'qty', 'uom')
+
+# Same fields as a set, so request validation is one set difference per label
+REQUIRED_LABEL_FIELDS = frozenset(LABEL_FIELDS)
+
+# Pulls all label fields, in LABEL_FIELDS order, in a single C-level call
+_label_values = itemgetter(*LABEL_FIELDS)
+
+# ZPL for one label: recall the stored format and fill its ^FN fields.
+# Positional %s slots, filled in LABEL_FIELDS order by a single % operation,
+# which is considerably cheaper per label than keyword str.format().
+LABEL_ZPL_TEMPLATE = "\n".join([
+    "^XA",           # Start format
+    f"^XF{LABEL_FORMAT_NAME}^FS",  # Recall stored format
+
+    "^FN1^FDLA,%s^FS",     # qr_code
+    "^FN2^FD%s^FS",        # do_number
+    "^FN3^FD%s %s^FS",     # route, date
+    "^FN4^FD%s^FS",        # customer
+    "^FN5^FD%s %s^FS",     # so_number, mo_number
+    "^FN6^FD%s^FS",        # item
+    "^FN7^FD%s %s^FS",     # qty, uom
+
+    "^XZ"            # End format
+])
+
+
+@lru_cache(maxsize=1024)
+def _label_to_zpl(values: tuple) -> str:
+    """Render the ZPL block for one label's field values. Repeated labels are served from cache."""
+    return LABEL_ZPL_TEMPLATE % values
+
+
+def _render_label(label: Dict) -> str:
+    """Render a label dict; raises KeyError if a field is missing."""
+    return _label_to_zpl(tuple(map(str, _label_values(label))))
+
+
+def json_to_zpl(label_data: Dict) -> str:
+    """
+    Convert JSON label data directly to ZPL commands.
+    No PDF processing needed!
+
+    Expected JSON format:
+    {
+        "labels": [
+            {
+                "qr_code": "01010101160",
+                "do_number": "W-CPN/OUT/00002",
+                "route": "Route A",
+                "date": "12/04/22",
+                "customer": "Customer Name",
+                "so_number": "SO-67890",
+                "mo_number": "MO-12345",
+                "item": "Product Name",
+                "qty": "100",
+                "uom": "PCS"
+            }
+        ]
+    }
+    """
+    logger.info(f"[PROCESS] Converting {len(label_data['labels'])} labels to ZPL")
+
+    # Header, then one block per label separated by a blank line
+    label_blocks = "\n\n".join(
+        map(_render_label, label_data['labels'])
+    )
+    zpl_string = f"{ZPL_HEADER}\n{label_blocks}" if label_blocks else ZPL_HEADER
+    logger.info(f"[OK] Generated ZPL with {len(label_data['labels'])} labels")
+    return zpl_string
+
+
+def json_to_zpl_bytes(label_data: Dict) -> bytes:
+    """
+    Convert JSON label data to encoded ZPL ready for the printer.
+    
+    Produces the same output as json_to_zpl(label_data).encode(ZPL_ENCODING),
+    but appends each label into a bytearray instead of joining one large
+    string and encoding it afterwards, so large batches are not held in
+    memory twice.
+    """
+    logger.info(f"[PROCESS] Converting {len(label_data['labels'])} labels to ZPL")
+
+    buf = bytearray(ZPL_HEADER_BYTES)
+
+    for i, label in enumerate(label_data['labels']):
+        # Blank line between labels
+        buf += b"\n\n" if i else b"\n"
+        buf += _render_label(label).encode(ZPL_ENCODING)
+
+    logger.info(f"[OK] Generated ZPL with {len(label_data['labels'])} labels")
+    return bytes(buf)
@@ -9,6 +9,57 @@ from typing import Optional, List, Dict, Any
 from pathlib import Path
 from .models import TunnelConfig, SystemState, PrinterConfig
 
+# Bump when the schema below changes so existing databases pick it up
+SCHEMA_VERSION = 1
+
+# Schema DDL, run once per database file (tracked in PRAGMA user_version)
+SCHEMA_SQL = f"""
+    BEGIN;
+
+    -- Tunnel configurations table
+    CREATE TABLE IF NOT EXISTS tunnel_configs (
+        name TEXT PRIMARY KEY,
+        is_configured BOOLEAN DEFAULT FALSE,
+        is_active BOOLEAN DEFAULT FALSE,
+        current_url TEXT,
+        domain_mapping TEXT,
+        config_data TEXT,  -- JSON
+        last_used TIMESTAMP,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- System state table
+    CREATE TABLE IF NOT EXISTS system_state (
+        component TEXT PRIMARY KEY,
+        is_configured BOOLEAN DEFAULT FALSE,
+        is_running BOOLEAN DEFAULT FALSE,
+        config_data TEXT,  -- JSON
+        last_status TEXT,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Printer configurations table
+    CREATE TABLE IF NOT EXISTS printer_configs (
+        name TEXT PRIMARY KEY,
+        connection_type TEXT,
+        device_uri TEXT,
+        is_default BOOLEAN DEFAULT FALSE,
+        is_configured BOOLEAN DEFAULT FALSE,
+        last_tested TIMESTAMP,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Default printer lookup
+    CREATE INDEX IF NOT EXISTS idx_printer_configs_default
+    ON printer_configs (is_default) WHERE is_default = TRUE;
+
+    PRAGMA user_version = {SCHEMA_VERSION};
+
+    COMMIT;
+"""
+
 class DatabaseManager:
     """SQLite database manager for persistent configuration."""
     
@@ -20,53 +71,20 @@ class DatabaseManager:
         """Get database connection."""
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row  # Enable column access by name
+        conn.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, avoids fsync per commit
+        conn.execute("PRAGMA temp_store=MEMORY")   # Sorts/temp tables never touch disk
         return conn
     
     def init_database(self):
         """Initialize database tables."""
         with self.get_connection() as conn:
-            # Tunnel configurations table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS tunnel_configs (
-                    name TEXT PRIMARY KEY,
-                    is_configured BOOLEAN DEFAULT FALSE,
-                    is_active BOOLEAN DEFAULT FALSE,
-                    current_url TEXT,
-                    domain_mapping TEXT,
-                    config_data TEXT,  -- JSON
-                    last_used TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # System state table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS system_state (
-                    component TEXT PRIMARY KEY,
-                    is_configured BOOLEAN DEFAULT FALSE,
-                    is_running BOOLEAN DEFAULT FALSE,
-                    config_data TEXT,  -- JSON
-                    last_status TEXT,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+            # Schema already in place: one pragma read instead of re-running the DDL
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+                return
             
-            # Printer configurations table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS printer_configs (
-                    name TEXT PRIMARY KEY,
-                    connection_type TEXT,
-                    device_uri TEXT,
-                    is_default BOOLEAN DEFAULT FALSE,
-                    is_configured BOOLEAN DEFAULT FALSE,
-                    last_tested TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            conn.commit()
+            # Write-ahead logging (persists in the database file)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA_SQL)
     
     # Tunnel Config Methods
     def save_tunnel_config(self, config: TunnelConfig):
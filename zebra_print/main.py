@@ -114,9 +114,11 @@ class ZebraPrintApplication:
                     print(f"[*] Stopping {tunnel.name} tunnel...")
                     tunnel.stop()
             
-            # Close API client session
+            # Close API client and health check sessions
             if hasattr(self.api_client, 'close'):
                 self.api_client.close()
+            if hasattr(self.api_service, 'close'):
+                self.api_service.close()
                 
         except Exception as e:
             print(f"[WARNING] Cleanup warning: {e}")
@@ -4,7 +4,7 @@ Defines the contract that all printer implementations must follow.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple, Union
 
 class PrinterService(ABC):
     """Abstract base class for printer services."""
@@ -29,6 +29,33 @@ class PrinterService(ABC):
         """
         pass
     
+    @abstractmethod
+    def print_zpl(self, zpl_content: Union[str, bytes]) -> Tuple[bool, str]:
+        """
+        Send ZPL content to the printer as one job.
+        
+        Returns:
+            Tuple[bool, str]: (success, message)
+        """
+        pass
+    
+    def print_zpl_batch(self, zpl_jobs: List[Union[str, bytes]]) -> Tuple[bool, str]:
+        """
+        Send several ZPL documents to the printer as a single job.
+        
+        Each ^XA...^XZ block already starts a new label, so concatenating
+        the documents prints the same labels while paying the job
+        submission once instead of once per document.
+        
+        Returns:
+            Tuple[bool, str]: (success, message)
+        """
+        if not zpl_jobs:
+            return False, "No ZPL documents to print"
+        
+        encoded = [job.encode('utf-8') if isinstance(job, str) else job for job in zpl_jobs]
+        return self.print_zpl(b"\n".join(encoded))
+    
     @abstractmethod
     def test_connection(self) -> Tuple[bool, str]:
         """
@@ -5,14 +5,95 @@ Manages Zebra printer connection and status via CUPS.
 
 import subprocess
 import re
-from typing import Dict, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple, Union
 from zebra_print.printer.base import PrinterService
 
+# pycups talks to cupsd over its socket in-process; fall back to the
+# lp/lpstat command line tools when it is not installed
+try:
+    import cups
+except ImportError:
+    cups = None
+
+# Simple test label, filled in with the printer name
+TEST_LABEL_ZPL = """^XA
+^PR2
+^MD5
+^JMA
+^LH0,0
+^FO50,50^A0,16,16^FDTest Label^FS
+^FO50,80^A0,16,16^FDPrinter: {printer_name}^FS
+^FO50,110^A0,16,16^FDTime: $(time)^FS
+^XZ"""
+
+# CUPS printer-state values, as reported by lpstat -p
+CUPS_PRINTER_STATES = {3: 'idle', 4: 'printing', 5: 'stopped'}
+
+# pycups connections are not thread-safe, so each thread keeps its own
+_cups_local = threading.local()
+
+
+def _cups_connection():
+    """Return this thread's CUPS connection, or None if pycups is unavailable."""
+    if cups is None:
+        return None
+    
+    conn = getattr(_cups_local, 'conn', None)
+    if conn is None:
+        try:
+            conn = _cups_local.conn = cups.Connection()
+        except RuntimeError:
+            # cupsd not reachable; callers fall back to the command line tools
+            return None
+    return conn
+
+
+# "printer NAME STATUS..." lines from lpstat -p
+LPSTAT_PRINTER_LINE = re.compile(r'printer\s+(\S+)\s+(.*)')
+
+
+def list_printers() -> Dict[str, str]:
+    """
+    Map each CUPS printer name to its status.
+    
+    Uses getPrinters() over the pycups connection when available, which
+    returns already-parsed attributes; otherwise parses `lpstat -p`.
+    """
+    printers = {}
+    
+    conn = _cups_connection()
+    if conn is not None:
+        try:
+            for name, attrs in conn.getPrinters().items():
+                state = CUPS_PRINTER_STATES.get(attrs.get('printer-state'), 'unknown')
+                printers[name] = f"is {state}."
+            return printers
+        except (cups.IPPError, cups.HTTPError, RuntimeError):
+            _cups_local.conn = None
+    
+    try:
+        result = subprocess.run(['lpstat', '-p'], capture_output=True, text=True, timeout=10)
+        if result.returncode == 0:
+            for line in result.stdout.splitlines():
+                match = LPSTAT_PRINTER_LINE.match(line)
+                if match:
+                    name, status = match.groups()
+                    printers[name] = status
+                    
+    except Exception:
+        pass
+    
+    return printers
+
 class ZebraCUPSPrinter(PrinterService):
     """CUPS-based Zebra printer service implementation."""
     
     def __init__(self, printer_name: str = "ZTC-ZD230-203dpi-ZPL"):
         self._printer_name = printer_name
+        self._test_label_zpl = TEST_LABEL_ZPL.format(printer_name=printer_name).encode('utf-8')
+        self._lp_argv = ('lp', '-d', printer_name, '-o', 'raw')
     
     @property
     def name(self) -> str:
@@ -48,10 +129,19 @@ class ZebraCUPSPrinter(PrinterService):
         }
         
         try:
-            # Get printer info
-            result = subprocess.run(['lpstat', '-p', self._printer_name], 
-                                  capture_output=True, text=True)
+            # The three lpstat probes are independent, so run them concurrently
+            # instead of paying each fork/CUPS round-trip back to back.
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = {
+                    flag: executor.submit(subprocess.run, ['lpstat', flag, self._printer_name],
+                                          capture_output=True, text=True)
+                    for flag in ('-p', '-o', '-v')
+                }
+                result = futures['-p'].result()
+                queue_result = futures['-o'].result()
+                conn_result = futures['-v'].result()
             
+            # Get printer info
             if result.returncode == 0:
                 status['exists'] = True
                 output = result.stdout.lower()
@@ -66,15 +156,11 @@ class ZebraCUPSPrinter(PrinterService):
                     status['accepting_jobs'] = True
             
             # Get job queue info
-            queue_result = subprocess.run(['lpstat', '-o', self._printer_name], 
-                                        capture_output=True, text=True)
             if queue_result.returncode == 0:
                 jobs = queue_result.stdout.strip().split('\n')
                 status['jobs_queued'] = len([j for j in jobs if j.strip()])
             
             # Check printer connection via lpstat -v
-            conn_result = subprocess.run(['lpstat', '-v', self._printer_name], 
-                                       capture_output=True, text=True)
             if conn_result.returncode == 0:
                 output = conn_result.stdout
                 if 'usb://' in output:
@@ -89,29 +175,72 @@ class ZebraCUPSPrinter(PrinterService):
         
         return status
     
-    def print_zpl(self, zpl_content: str) -> Tuple[bool, str]:
-        """Send ZPL content to printer."""
+    def print_zpl(self, zpl_content: Union[str, bytes]) -> Tuple[bool, str]:
+        """Send ZPL content to printer. Pre-encoded bytes are sent as-is."""
+        # Encode once up front rather than letting a text-mode pipe
+        # re-encode it inside communicate()
+        if isinstance(zpl_content, str):
+            zpl_content = zpl_content.encode('utf-8')
+        
+        conn = _cups_connection()
+        if conn is not None:
+            try:
+                job_id = conn.createJob(self._printer_name, 'ZPL labels', {'raw': 'true'})
+            except (cups.IPPError, cups.HTTPError, RuntimeError):
+                # Nothing queued yet: drop the stale or refused connection
+                # and let lp retry
+                _cups_local.conn = None
+            else:
+                return self._print_via_cups(conn, job_id, zpl_content)
+        
+        return self._print_via_lp(zpl_content)
+    
+    def _print_via_cups(self, conn, job_id: int, zpl_content: bytes) -> Tuple[bool, str]:
+        """
+        Send raw ZPL as the document of an already created CUPS job.
+        
+        Once the job exists a failure is not retried through lp, which could
+        print the labels twice; the partial job is cancelled instead.
+        """
+        try:
+            conn.startDocument(self._printer_name, job_id, 'labels.zpl', cups.CUPS_FORMAT_RAW, 1)
+            conn.writeRequestData(zpl_content, len(zpl_content))
+            conn.finishDocument(self._printer_name)
+        except (cups.IPPError, cups.HTTPError, RuntimeError) as e:
+            try:
+                conn.cancelJob(job_id)
+            except (cups.IPPError, cups.HTTPError, RuntimeError):
+                pass
+            _cups_local.conn = None
+            return False, f"Print failed: CUPS job {job_id} cancelled: {e}"
+        
+        return True, f"request id is {self._printer_name}-{job_id}"
+    
+    def _print_via_lp(self, zpl_content: bytes) -> Tuple[bool, str]:
+        """Pipe raw ZPL to the lp command."""
         try:
             # Send ZPL commands to printer via CUPS
             process = subprocess.Popen(
-                ['lp', '-d', self._printer_name, '-o', 'raw'],
+                self._lp_argv,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stderr=subprocess.PIPE
             )
             
+            # communicate() takes the bytes as-is, enforces the timeout while
+            # writing, and keeps lp's stderr if lp exits before reading it all
             stdout, stderr = process.communicate(input=zpl_content, timeout=30)
             
             if process.returncode == 0:
-                job_info = stdout.strip() if stdout else "Job submitted successfully"
+                job_info = stdout.decode().strip() if stdout else "Job submitted successfully"
                 return True, job_info
             else:
-                error_msg = stderr.strip() if stderr else "Unknown printing error"
+                error_msg = stderr.decode().strip() if stderr else "Unknown printing error"
                 return False, f"Print failed: {error_msg}"
                 
         except subprocess.TimeoutExpired:
             process.kill()
+            process.communicate()
             return False, "Print timeout - job took too long"
         except Exception as e:
             return False, f"Print error: {str(e)}"
@@ -122,67 +251,37 @@ class ZebraCUPSPrinter(PrinterService):
             # Send a simple test command to printer
             test_zpl = "^XA^HH^XZ"  # Simple ZPL command to test communication
             
-            process = subprocess.run([
-                'echo', '-e', test_zpl, '|', 'lp', '-d', self._printer_name, '-o', 'raw'
-            ], shell=True, capture_output=True, text=True)
+            # Feed the command to lp's stdin directly; no shell or echo process
+            process = subprocess.run(self._lp_argv, input=test_zpl, capture_output=True,
+                                     text=True, timeout=30)
             
             if process.returncode == 0:
                 return True, "Printer connection test successful"
             else:
                 return False, f"Connection test failed: {process.stderr}"
                 
+        except subprocess.TimeoutExpired:
+            return False, "Connection test timeout"
         except Exception as e:
             return False, f"Connection test error: {str(e)}"
     
     def print_test_label(self) -> Tuple[bool, str]:
         """Print a test label to verify printer functionality."""
         try:
-            # Create a simple test ZPL label
-            test_zpl = """^XA
-^PR2
-^MD5
-^JMA
-^LH0,0
-^FO50,50^A0,16,16^FDTest Label^FS
-^FO50,80^A0,16,16^FDPrinter: """ + self._printer_name + """^FS
-^FO50,110^A0,16,16^FDTime: $(time)^FS
-^XZ"""
-            
-            # Send to printer
-            process = subprocess.Popen(['lp', '-d', self._printer_name, '-o', 'raw'], 
-                                     stdin=subprocess.PIPE, 
-                                     stdout=subprocess.PIPE, 
-                                     stderr=subprocess.PIPE, 
-                                     text=True)
-            
-            stdout, stderr = process.communicate(input=test_zpl)
+            # Send the pre-encoded test label to printer
+            success, message = self.print_zpl(self._test_label_zpl)
             
-            if process.returncode == 0:
+            if success:
                 return True, "Test label sent to printer successfully"
             else:
-                return False, f"Failed to print test label: {stderr}"
+                return False, f"Failed to print test label: {message}"
                 
         except Exception as e:
             return False, f"Test print error: {str(e)}"
     
     def get_printer_list(self) -> Dict[str, str]:
         """Get list of available printers."""
-        printers = {}
-        
-        try:
-            result = subprocess.run(['lpstat', '-p'], capture_output=True, text=True)
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    match = re.match(r'printer\s+(\S+)\s+(.*)', line)
-                    if match:
-                        name, status = match.groups()
-                        printers[name] = status
-                        
-        except Exception:
-            pass
-        
-        return printers
+        return list_printers()
     
     def setup_printer(self, device_uri: str = None) -> Tuple[bool, str]:
         """Setup/configure the printer in CUPS."""
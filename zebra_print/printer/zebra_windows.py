@@ -8,7 +8,9 @@ import platform
 import tempfile
 import os
 import re
-from typing import Dict, Tuple, List
+import shutil
+import time
+from typing import Dict, Tuple, List, Optional, Union
 from zebra_print.printer.base import PrinterService
 
 class ZebraWindowsPrinter(PrinterService):
@@ -245,9 +247,13 @@ class ZebraWindowsPrinter(PrinterService):
         except Exception as e:
             return False, f"Setup failed: {str(e)}"
     
-    def print_zpl(self, zpl_content: str) -> Tuple[bool, str]:
+    def print_zpl(self, zpl_content: Union[str, bytes]) -> Tuple[bool, str]:
         """Print ZPL content directly to the printer."""
         try:
+            # The spooler methods below all work from text files
+            if isinstance(zpl_content, bytes):
+                zpl_content = zpl_content.decode('utf-8')
+            
             # First check if printer is enabled
             status = self.get_status()
             if not status['enabled'] or not status['accepting_jobs']:
@@ -255,12 +261,16 @@ class ZebraWindowsPrinter(PrinterService):
                 if not enable_success:
                     return False, f"Printer is disabled and could not be enabled: {enable_msg}"
             
-            # Create temporary file with ZPL content
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.zpl', delete=False) as temp_file:
-                temp_file.write(zpl_content)
-                temp_file_path = temp_file.name
-            
+            # Stage ZPL in a private temp directory; any helper files written
+            # next to it (e.g. the .bin copy for PowerShell) go with the tree.
+            # Removed with ignore_errors since the spooler may still hold the
+            # file (TemporaryDirectory only allows that on Python 3.10+).
+            temp_dir = tempfile.mkdtemp()
             try:
+                temp_file_path = os.path.join(temp_dir, 'label.zpl')
+                with open(temp_file_path, 'w') as temp_file:
+                    temp_file.write(zpl_content)
+                
                 # Always try copy command first (like the working direct test)
                 cmd = f'copy "{temp_file_path}" "\\\\localhost\\{self._printer_name}"'
                 result = subprocess.run(cmd, shell=True, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
@@ -277,14 +287,9 @@ class ZebraWindowsPrinter(PrinterService):
                 else:
                     # For network printers, try other methods
                     return self._try_direct_printer_port(zpl_content, temp_file_path)
-                    
             finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
-                    
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
         except Exception as e:
             return False, f"Print error: {str(e)}"
     
@@ -312,28 +317,13 @@ class ZebraWindowsPrinter(PrinterService):
             result = subprocess.run(print_cmd, shell=True, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
             
             if result.returncode == 0:
-                # Wait and verify the job was actually processed
-                import time
-                time.sleep(1)  # Give printer time to process
-                
-                # Check if there are any print jobs still queued
-                queue_cmd = [
-                    "powershell", "-Command",
-                    f"Get-PrintJob -PrinterName '{self._printer_name}' | Measure-Object | Select-Object Count"
-                ]
-                queue_result = subprocess.run(queue_cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
+                # Poll the spooler until the job has been processed
+                job_count = self._wait_for_empty_queue()
                 
-                if queue_result.returncode == 0:
-                    try:
-                        count_match = re.search(r'Count\s*:\s*(\d+)', queue_result.stdout)
-                        if count_match:
-                            job_count = int(count_match.group(1))
-                            if job_count == 0:
-                                return True, "ZPL sent to USB printer successfully via print command and job completed"
-                            else:
-                                return False, f"Print job sent but {job_count} jobs still queued - may have failed"
-                    except:
-                        pass
+                if job_count == 0:
+                    return True, "ZPL sent to USB printer successfully via print command and job completed"
+                elif job_count is not None:
+                    return False, f"Print job sent but {job_count} jobs still queued - may have failed"
                 
                 return True, "ZPL sent to USB printer successfully via print command (job verification failed)"
         except Exception as e:
@@ -352,12 +342,6 @@ class ZebraWindowsPrinter(PrinterService):
             ]
             ps_result = subprocess.run(ps_cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
             
-            # Clean up binary file
-            try:
-                os.unlink(binary_file)
-            except:
-                pass
-            
             if ps_result.returncode == 0:
                 return True, "ZPL sent to USB printer successfully via PowerShell raw printing"
         except Exception as e:
@@ -396,6 +380,36 @@ class ZebraWindowsPrinter(PrinterService):
         # All methods failed
         return False, f"All USB printing methods failed. Printer may not support raw ZPL printing or needs driver reconfiguration."
     
+    def _get_queued_job_count(self) -> Optional[int]:
+        """Get number of jobs queued for this printer, or None if unknown."""
+        queue_cmd = [
+            "powershell", "-Command",
+            f"Get-PrintJob -PrinterName '{self._printer_name}' | Measure-Object | Select-Object Count"
+        ]
+        queue_result = subprocess.run(queue_cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
+        
+        if queue_result.returncode == 0:
+            count_match = re.search(r'Count\s*:\s*(\d+)', queue_result.stdout)
+            if count_match:
+                return int(count_match.group(1))
+        return None
+    
+    def _wait_for_empty_queue(self, timeout: float = 5.0) -> Optional[int]:
+        """Poll the print queue with backoff until it drains or the timeout expires.
+        
+        Returns the last observed job count (0 once the queue is empty), or
+        None if the queue could not be read.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.2
+        
+        while True:
+            job_count = self._get_queued_job_count()
+            if job_count == 0 or job_count is None or time.monotonic() >= deadline:
+                return job_count
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
+    
     def _enable_printer(self) -> Tuple[bool, str]:
         """Enable the printer and set it to accept jobs."""
         try:
@@ -10,6 +10,14 @@ import re
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+# Matches {{field}} placeholders in stored ZPL templates
+PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
+# Printer initialization block emitted once at the start of a batch
+PRINTER_INIT_ZPL = "\n".join([
+    "^XA", "^JUS", "^MMT", "^MNY", "^MTT", "^PON", "^PMN", "^LRN", "^CI0", "^XZ", ""
+])
+
 class TemplateManager:
     """Manages label templates for flexible printing."""
     
@@ -157,12 +165,16 @@ class TemplateManager:
             return False, f"Missing required fields: {missing_fields}"
         
         # Render ZPL template
-        zpl = template['zpl_template']
-        for field, value in data.items():
-            placeholder = f"{{{{{field}}}}}"
-            zpl = zpl.replace(placeholder, str(value))
+        return True, self._substitute_fields(template['zpl_template'], data)
+    
+    @staticmethod
+    def _substitute_fields(zpl_template: str, data: Dict) -> str:
+        """Replace {{field}} placeholders in a single pass over the template."""
+        def _replace(match):
+            field = match.group(1)
+            return str(data[field]) if field in data else match.group(0)
         
-        return True, zpl
+        return PLACEHOLDER_PATTERN.sub(_replace, zpl_template)
     
     def render_multiple_labels(self, template_name: str, label_data_list: List[Dict]) -> Tuple[bool, str]:
         """Render template for multiple labels."""
@@ -170,30 +182,27 @@ class TemplateManager:
         if not template:
             return False, f"Template '{template_name}' not found"
         
-        zpl_commands = []
-        
-        # Add printer initialization once
-        init_commands = [
-            "^XA", "^JUS", "^MMT", "^MNY", "^MTT", "^PON", "^PMN", "^LRN", "^CI0", "^XZ", ""
-        ]
-        zpl_commands.extend(init_commands)
+        # Strip the initialization block from the template once, not per label
+        label_template = template['zpl_template']
+        if "^XZ\n\n^XA" in label_template:
+            label_template = label_template.split("^XZ\n\n^XA", 1)[-1]
+        # Swap the first line for a bare ^XA without splitting the whole template into lines
+        _, newline, rest = label_template.partition('\n')
+        label_template = "^XA" + newline + rest
         
         # Render each label
-        for i, data in enumerate(label_data_list):
-            success, rendered_zpl = self.render_template(template_name, data)
-            if not success:
-                return False, rendered_zpl
-            
-            # Skip the initialization part of individual templates
-            label_zpl = rendered_zpl.split("^XZ\n\n^XA", 1)[-1] if "^XZ\n\n^XA" in rendered_zpl else rendered_zpl
-            zpl_commands.append("^XA")
-            zpl_commands.extend(label_zpl.split('\n')[1:])  # Skip first ^XA
-            
-            # Add spacing between labels
-            if i < len(label_data_list) - 1:
-                zpl_commands.append("")
+        labels = []
+        for data in label_data_list:
+            missing_fields = [field for field in template['required_fields'] if field not in data]
+            if missing_fields:
+                return False, f"Missing required fields: {missing_fields}"
+            labels.append(self._substitute_fields(label_template, data))
         
-        return True, "\n".join(zpl_commands)
+        # Printer initialization once, then labels separated by a blank line
+        zpl = PRINTER_INIT_ZPL
+        if labels:
+            zpl += "\n" + "\n\n".join(labels)
+        return True, zpl
     
     def update_template(self, name: str, description: str = None, zpl_template: str = None,
                        required_fields: List[str] = None, label_size: str = None) -> bool:
@@ -3,8 +3,24 @@ Tunnel providers module.
 Contains implementations for different tunnel services.
 """
 
+from importlib import import_module
+
 from .base import TunnelProvider
-from .cloudflare import CloudflareTunnel
-from .ngrok import NgrokTunnel
 
-__all__ = ['TunnelProvider', 'CloudflareTunnel', 'NgrokTunnel']
\ No newline at end of file
+# Implementations import requests; load them on first access rather than
+# with the package, so importing e.g. zebra_print.tunnel.cloudflare_named stays cheap
+_LAZY_EXPORTS = {
+    'CloudflareTunnel': '.cloudflare',
+    'NgrokTunnel': '.ngrok',
+}
+
+__all__ = ['TunnelProvider', 'CloudflareTunnel', 'NgrokTunnel']
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,11 +4,13 @@ Provides permanent URL solution using Cloudflare tunnels.
 """
 
 import os
+import shutil
 import json
 import subprocess
 import time
 from typing import Dict, Optional, Tuple
 from zebra_print.tunnel.base import TunnelProvider
+from zebra_print.utils.process_manager import ProcessManager
 
 class CloudflareTunnel(TunnelProvider):
     """Cloudflare tunnel provider implementation."""
@@ -40,15 +42,11 @@ class CloudflareTunnel(TunnelProvider):
             # Check if cloudflared is installed (cross-platform)
             import platform
             if platform.system() == "Windows":
-                result = subprocess.run(['where', 'cloudflared'], 
-                                      capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
                 install_msg = "cloudflared not found. Download from: https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-windows-amd64.exe"
             else:
-                result = subprocess.run(['which', 'cloudflared'], 
-                                      capture_output=True, text=True)
                 install_msg = "cloudflared not found. Please install: curl -L --output cloudflared.deb https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-amd64.deb && sudo dpkg -i cloudflared.deb"
             
-            if result.returncode != 0:
+            if shutil.which('cloudflared') is None:
                 return False, install_msg
             
             # Test cloudflared can run
@@ -84,9 +82,9 @@ class CloudflareTunnel(TunnelProvider):
             ]
         }
         
+        # JSON is valid YAML, so cloudflared reads this without needing PyYAML
         with open(self.config_file, 'w') as f:
-            import yaml
-            yaml.safe_dump(config, f, default_flow_style=False)
+            json.dump(config, f, indent=2)
     
     def start(self) -> Tuple[bool, str, Optional[str]]:
         """Start the Cloudflare tunnel."""
@@ -108,7 +106,7 @@ class CloudflareTunnel(TunnelProvider):
                                          text=True, bufsize=1, universal_newlines=True)
             else:
                 process = subprocess.Popen(cmd, stdout=subprocess.PIPE, 
-                                         stderr=subprocess.STDOUT, preexec_fn=os.setsid, 
+                                         stderr=subprocess.STDOUT, start_new_session=True, 
                                          text=True, bufsize=1, universal_newlines=True)
             
             # Save PID
@@ -167,10 +165,11 @@ class CloudflareTunnel(TunnelProvider):
                 # On Windows, use taskkill to terminate the process tree
                 subprocess.run(['taskkill', '/F', '/T', '/PID', str(pid)], 
                              capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW)
+                time.sleep(2)
             else:
-                # On Linux, kill process group
+                # On Linux, kill process group and continue as soon as it exits
                 os.killpg(os.getpgid(pid), 15)  # SIGTERM
-            time.sleep(2)
+                ProcessManager.wait_for_exit(pid, timeout=2)
             
             # Remove PID file
             os.remove(self.pid_file)
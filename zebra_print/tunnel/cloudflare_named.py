@@ -4,14 +4,22 @@ Provides permanent URLs with custom subdomains like tln-zebra-01.abcfood.app
 """
 
 import os
+import re
+import shutil
 import json
 import subprocess
 import time
-import yaml
 from typing import Dict, Optional, Tuple
 from zebra_print.tunnel.base import TunnelProvider
 from zebra_print.database.db_manager import DatabaseManager
 from zebra_print.database.models import TunnelConfig
+from zebra_print.utils.process_manager import ProcessManager
+
+# Lowercase hostname with at least two labels: 1-63 chars of [a-z0-9-] each,
+# no label starting or ending with a hyphen, 253 chars at most overall
+DOMAIN_PATTERN = re.compile(
+    r'^(?=.{1,253}\Z)(?!-)[a-z0-9-]{1,63}(?<!-)(?:\.(?!-)[a-z0-9-]{1,63}(?<!-))+\Z'
+)
 
 class CloudflareNamedTunnel(TunnelProvider):
     """Cloudflare Named Tunnel with custom domain mapping."""
@@ -41,7 +49,10 @@ class CloudflareNamedTunnel(TunnelProvider):
     
     def set_custom_domain(self, domain: str) -> Tuple[bool, str]:
         """Set custom domain for this tunnel."""
-        if not domain or '.' not in domain:
+        # Cheap string checks reject the obvious cases before the regex
+        if not domain or '.' not in domain or ' ' in domain or '..' in domain:
+            return False, "Invalid domain format"
+        if not DOMAIN_PATTERN.match(domain):
             return False, "Invalid domain format"
         
         self.custom_domain = domain
@@ -63,15 +74,11 @@ class CloudflareNamedTunnel(TunnelProvider):
             # Check if cloudflared is installed (cross-platform)
             import platform
             if platform.system() == "Windows":
-                result = subprocess.run(['where', 'cloudflared'], 
-                                      capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
                 install_msg = "cloudflared not found. Download from: https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-windows-amd64.exe"
             else:
-                result = subprocess.run(['which', 'cloudflared'], 
-                                      capture_output=True, text=True)
                 install_msg = "cloudflared not found. Install: curl -L --output cloudflared.deb https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-amd64.deb && sudo dpkg -i cloudflared.deb"
             
-            if result.returncode != 0:
+            if shutil.which('cloudflared') is None:
                 return False, install_msg
             
             # Check authentication (try multiple possible locations)
@@ -269,8 +276,20 @@ class CloudflareNamedTunnel(TunnelProvider):
             ]
         }
         
+        # JSON is valid YAML, so cloudflared reads this without needing PyYAML
+        config_text = json.dumps(config, indent=2)
+        
+        # Re-running setup usually produces the same config; leave the file
+        # (and its mtime) alone in that case
+        try:
+            with open(self.config_file, 'r') as f:
+                if f.read() == config_text:
+                    return
+        except OSError:
+            pass
+        
         with open(self.config_file, 'w') as f:
-            yaml.safe_dump(config, f, default_flow_style=False)
+            f.write(config_text)
     
     def start(self) -> Tuple[bool, str, Optional[str]]:
         """Start the Named Tunnel."""
@@ -312,7 +331,7 @@ class CloudflareNamedTunnel(TunnelProvider):
                                              creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
                 else:
                     process = subprocess.Popen(cmd, stdout=f, stderr=subprocess.STDOUT, 
-                                             preexec_fn=os.setsid, cwd=cwd)
+                                             start_new_session=True, cwd=cwd)
             
             # Save PID
             with open(self.pid_file, 'w') as f:
@@ -325,9 +344,8 @@ class CloudflareNamedTunnel(TunnelProvider):
             if not self._verify_tunnel_health():
                 # Read logs for debugging
                 try:
-                    with open(log_file, 'r') as f:
-                        logs = f.read()
-                    return False, f"Tunnel failed to start properly. Logs: {logs[-500:]}", None
+                    logs = ProcessManager.read_log_tail(log_file, 500)
+                    return False, f"Tunnel failed to start properly. Logs: {logs}", None
                 except:
                     return False, "Tunnel failed to start and no logs available", None
             
@@ -358,10 +376,11 @@ class CloudflareNamedTunnel(TunnelProvider):
                 # On Windows, use taskkill to terminate the process tree
                 subprocess.run(['taskkill', '/F', '/T', '/PID', str(pid)], 
                              capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW)
+                time.sleep(2)
             else:
-                # On Linux, kill process group
+                # On Linux, kill process group and continue as soon as it exits
                 os.killpg(os.getpgid(pid), 15)  # SIGTERM
-            time.sleep(2)
+                ProcessManager.wait_for_exit(pid, timeout=2)
             
             # Remove PID file
             os.remove(self.pid_file)
@@ -421,13 +440,19 @@ class CloudflareNamedTunnel(TunnelProvider):
                     # Check if our tunnel name appears in the output
                     if ps_result.returncode == 0 and self.tunnel_name in ps_result.stdout:
                         return True
-                else:
-                    ps_result = subprocess.run(['pgrep', '-f', f'cloudflared.*{self.tunnel_name}'], 
-                                             capture_output=True, text=True)
                     if ps_result.returncode == 0:
                         return True
-                if ps_result.returncode == 0:
-                    return True
+                else:
+                    # Confirm the PID is our cloudflared from /proc, without forking pgrep
+                    cmdline = ProcessManager.read_cmdline(pid)
+                    if cmdline is not None:
+                        if 'cloudflared' in cmdline and self.tunnel_name in cmdline:
+                            return True
+                    else:
+                        ps_result = subprocess.run(['pgrep', '-f', f'cloudflared.*{self.tunnel_name}'], 
+                                                 capture_output=True, text=True)
+                        if ps_result.returncode == 0:
+                            return True
                     
             except (OSError, ProcessLookupError, ValueError):
                 pass
@@ -4,6 +4,7 @@ Provides instant URLs without domain ownership requirements.
 """
 
 import os
+import shutil
 import subprocess
 import time
 import re
@@ -11,6 +12,7 @@ from typing import Dict, Optional, Tuple
 from zebra_print.tunnel.base import TunnelProvider
 from zebra_print.database.db_manager import DatabaseManager
 from zebra_print.database.models import TunnelConfig
+from zebra_print.utils.process_manager import ProcessManager
 
 class CloudflareQuickTunnel(TunnelProvider):
     """Cloudflare Quick Tunnel - no domain ownership required."""
@@ -38,14 +40,7 @@ class CloudflareQuickTunnel(TunnelProvider):
         # Quick tunnels require no setup - just authentication
         try:
             # Check if cloudflared is available (cross-platform)
-            import platform
-            if platform.system() == "Windows":
-                result = subprocess.run(['where', 'cloudflared'], 
-                                      capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
-            else:
-                result = subprocess.run(['which', 'cloudflared'], 
-                                      capture_output=True, text=True)
-            if result.returncode != 0:
+            if shutil.which('cloudflared') is None:
                 return False, "cloudflared not found"
             
             # Save configuration (minimal for quick tunnel)
@@ -81,7 +76,7 @@ class CloudflareQuickTunnel(TunnelProvider):
                     process = subprocess.Popen(cmd, stdout=log, stderr=log, 
                                              creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
                 else:
-                    process = subprocess.Popen(cmd, stdout=log, stderr=log, preexec_fn=os.setsid)
+                    process = subprocess.Popen(cmd, stdout=log, stderr=log, start_new_session=True)
             
             # Save PID
             with open(self.pid_file, 'w') as f:
@@ -130,10 +125,11 @@ class CloudflareQuickTunnel(TunnelProvider):
                 # On Windows, use taskkill to terminate the process tree
                 subprocess.run(['taskkill', '/F', '/T', '/PID', str(pid)], 
                              capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW)
+                time.sleep(2)
             else:
-                # On Linux, kill process group
+                # On Linux, kill process group and continue as soon as it exits
                 os.killpg(os.getpgid(pid), 15)  # SIGTERM
-            time.sleep(2)
+                ProcessManager.wait_for_exit(pid, timeout=2)
             
             # Remove files
             for file_path in [self.pid_file, self.log_file]:
@@ -4,12 +4,14 @@ Provides temporary URL solution using ngrok tunnels.
 """
 
 import os
+import shutil
 import json
 import subprocess
 import time
 import requests
 from typing import Dict, Optional, Tuple
 from zebra_print.tunnel.base import TunnelProvider
+from zebra_print.utils.process_manager import ProcessManager
 
 class NgrokTunnel(TunnelProvider):
     """Ngrok tunnel provider implementation."""
@@ -38,15 +40,11 @@ class NgrokTunnel(TunnelProvider):
             # Check if ngrok is installed (cross-platform)
             import platform
             if platform.system() == "Windows":
-                result = subprocess.run(['where', 'ngrok'], 
-                                      capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
                 install_msg = "ngrok not found. Download from: https://ngrok.com/download"
             else:
-                result = subprocess.run(['which', 'ngrok'], 
-                                      capture_output=True, text=True)
                 install_msg = "ngrok not found. Please install: curl -s https://ngrok-agent.s3.amazonaws.com/ngrok.asc | sudo tee /etc/apt/trusted.gpg.d/ngrok.asc >/dev/null && echo \"deb https://ngrok-agent.s3.amazonaws.com buster main\" | sudo tee /etc/apt/sources.list.d/ngrok.list && sudo apt update && sudo apt install ngrok"
             
-            if result.returncode != 0:
+            if shutil.which('ngrok') is None:
                 return False, install_msg
             
             # Check if authenticated
@@ -81,7 +79,7 @@ class NgrokTunnel(TunnelProvider):
                                          creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
             else:
                 process = subprocess.Popen(cmd, stdout=subprocess.PIPE, 
-                                         stderr=subprocess.PIPE, preexec_fn=os.setsid)
+                                         stderr=subprocess.PIPE, start_new_session=True)
             
             # Save PID
             with open(self.pid_file, 'w') as f:
@@ -117,10 +115,11 @@ class NgrokTunnel(TunnelProvider):
                 # On Windows, use taskkill to terminate the process tree
                 subprocess.run(['taskkill', '/F', '/T', '/PID', str(pid)], 
                              capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW)
+                time.sleep(2)
             else:
-                # On Linux, kill process group
+                # On Linux, kill process group and continue as soon as it exits
                 os.killpg(os.getpgid(pid), 15)  # SIGTERM
-            time.sleep(2)
+                ProcessManager.wait_for_exit(pid, timeout=2)
             
             # Remove PID file
             os.remove(self.pid_file)
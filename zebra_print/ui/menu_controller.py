@@ -3,13 +3,64 @@ Menu controller for the CLI interface.
 Handles user interaction and menu navigation.
 """
 
+import atexit
 import os
+import platform
+import socket
+import subprocess
 import sys
 import time
+import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Tuple
 from zebra_print.core.system_status import SystemStatus
 from zebra_print.core.label_service import LabelService
 
+# Shared session for calls to the local API, so repeated health and token
+# requests reuse one keep-alive connection instead of reconnecting each time
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
+atexit.register(_SESSION.close)
+
+# Menu screens, built once instead of printed line by line on every redraw
+MAIN_MENU = "\n".join([
+    "\n[INFO] MAIN MENU:",
+    "1. [STATUS] System Status",
+    "2. [START] Start API Server",
+    "3. [STOP] Stop API Server",
+    "4. [TUNNEL] Setup Tunnel",
+    "5. [URL] Start Tunnel",
+    "6. [STOP]  Stop Tunnel",
+    "7. [PRINTER]️  Printer Management",
+    "8. [TEST] Test Functions",
+    "9. [SEND] Integration Test",
+    "A. [AUTH] API Security",
+    "0. [EXIT] Exit",
+    "-" * 40,
+])
+
+PRINTER_MENU = "\n".join([
+    "\n[PRINTER]️  PRINTER MANAGEMENT:",
+    "1. [INFO] Printer Status",
+    "2. [CONFIG] Setup/Configure Printer",
+    "3. [TEST] Test Connection",
+    "4. [DOCUMENT] Print Test Label",
+    "5. [INPUT] List All Printers",
+    "6. [DEBUG] Debug Printer Setup",
+    "0. [BACK]  Back to Main Menu",
+])
+
+TEST_MENU = "\n".join([
+    "\n[TEST] TEST FUNCTIONS:",
+    "1. [HEALTH] API Health Check",
+    "2. [TUNNEL] Tunnel Connection Test",
+    "3. [DOCUMENT] Print Sample Label (Local API)",
+    "4. [WORLD] Print Sample Label (via Tunnel)",
+    "5. [INFO] Custom Label Test",
+    "6. [NETWORK] Network Diagnostics (Windows)",
+    "0. [BACK]  Back to Main Menu",
+])
+
 class MenuController:
     """Controls the CLI menu system and user interactions."""
     
@@ -17,6 +68,36 @@ class MenuController:
         self.system_status = system_status
         self.label_service = label_service
         self.running = True
+        
+        # Menu choice -> handler
+        self._main_actions = {
+            "1": self._show_status,
+            "2": self._start_api_server,
+            "3": self._stop_api_server,
+            "4": self._setup_tunnel,
+            "5": self._start_tunnel,
+            "6": self._stop_tunnel,
+            "7": self.handle_printer_management,
+            "8": self.handle_test_functions,
+            "9": self._integration_test,
+            "A": self._api_security_menu,
+        }
+        self._printer_actions = {
+            "1": self._show_printer_status,
+            "2": self._setup_printer,
+            "3": self._test_printer_connection,
+            "4": self._print_test_label,
+            "5": self._list_all_printers,
+            "6": self._debug_printer_setup,
+        }
+        self._test_actions = {
+            "1": self._test_api_health,
+            "2": self._test_tunnel_connection,
+            "3": self._test_local_print,
+            "4": self._test_tunnel_print,
+            "5": self._test_custom_label,
+            "6": self._run_network_diagnostics,
+        }
     
     def display_banner(self):
         """Display application banner."""
@@ -27,19 +108,7 @@ class MenuController:
     
     def display_main_menu(self):
         """Display the main menu options."""
-        print("\n[INFO] MAIN MENU:")
-        print("1. [STATUS] System Status")
-        print("2. [START] Start API Server")
-        print("3. [STOP] Stop API Server")
-        print("4. [TUNNEL] Setup Tunnel")
-        print("5. [URL] Start Tunnel")
-        print("6. [STOP]  Stop Tunnel")
-        print("7. [PRINTER]️  Printer Management")
-        print("8. [TEST] Test Functions")
-        print("9. [SEND] Integration Test")
-        print("A. [AUTH] API Security")
-        print("0. [EXIT] Exit")
-        print("-" * 40)
+        print(MAIN_MENU)
     
     def display_system_status(self):
         """Display comprehensive system status."""
@@ -108,25 +177,11 @@ class MenuController:
     
     def display_printer_menu(self):
         """Display printer management menu."""
-        print("\n[PRINTER]️  PRINTER MANAGEMENT:")
-        print("1. [INFO] Printer Status")
-        print("2. [CONFIG] Setup/Configure Printer")
-        print("3. [TEST] Test Connection")
-        print("4. [DOCUMENT] Print Test Label")
-        print("5. [INPUT] List All Printers")
-        print("6. [DEBUG] Debug Printer Setup")
-        print("0. [BACK]  Back to Main Menu")
+        print(PRINTER_MENU)
     
     def display_test_menu(self):
         """Display test functions menu."""
-        print("\n[TEST] TEST FUNCTIONS:")
-        print("1. [HEALTH] API Health Check")
-        print("2. [TUNNEL] Tunnel Connection Test")
-        print("3. [DOCUMENT] Print Sample Label (Local API)")
-        print("4. [WORLD] Print Sample Label (via Tunnel)")
-        print("5. [INFO] Custom Label Test")
-        print("6. [NETWORK] Network Diagnostics (Windows)")
-        print("0. [BACK]  Back to Main Menu")
+        print(TEST_MENU)
     
     def handle_printer_management(self):
         """Handle printer management operations."""
@@ -136,18 +191,10 @@ class MenuController:
             
             if choice == "0":
                 break
-            elif choice == "1":
-                self._show_printer_status()
-            elif choice == "2":
-                self._setup_printer()
-            elif choice == "3":
-                self._test_printer_connection()
-            elif choice == "4":
-                self._print_test_label()
-            elif choice == "5":
-                self._list_all_printers()
-            elif choice == "6":
-                self._debug_printer_setup()
+            
+            action = self._printer_actions.get(choice)
+            if action:
+                action()
             else:
                 print("[ERROR] Invalid option")
             
@@ -161,18 +208,10 @@ class MenuController:
             
             if choice == "0":
                 break
-            elif choice == "1":
-                self._test_api_health()
-            elif choice == "2":
-                self._test_tunnel_connection()
-            elif choice == "3":
-                self._test_local_print()
-            elif choice == "4":
-                self._test_tunnel_print()
-            elif choice == "5":
-                self._test_custom_label()
-            elif choice == "6":
-                self._run_network_diagnostics()
+            
+            action = self._test_actions.get(choice)
+            if action:
+                action()
             else:
                 print("[ERROR] Invalid option")
             
@@ -409,27 +448,11 @@ class MenuController:
                 if choice == "0":
                     self.running = False
                     print("\n[BYE] Goodbye!")
-                elif choice == "1":
-                    # Status already shown above
-                    input("\nPress Enter to continue...")
-                elif choice == "2":
-                    self._start_api_server()
-                elif choice == "3":
-                    self._stop_api_server()
-                elif choice == "4":
-                    self._setup_tunnel()
-                elif choice == "5":
-                    self._start_tunnel()
-                elif choice == "6":
-                    self._stop_tunnel()
-                elif choice == "7":
-                    self.handle_printer_management()
-                elif choice == "8":
-                    self.handle_test_functions()
-                elif choice == "9":
-                    self._integration_test()
-                elif choice.upper() == "A":
-                    self._api_security_menu()
+                    continue
+                
+                action = self._main_actions.get(choice.upper())
+                if action:
+                    action()
                 else:
                     print("[ERROR] Invalid option")
                     input("\nPress Enter to continue...")
@@ -441,14 +464,17 @@ class MenuController:
             print(f"\n[ERROR] An error occurred: {e}")
             input("\nPress Enter to continue...")
     
+    def _show_status(self):
+        """Pause on the system status (already shown above the menu)."""
+        input("\nPress Enter to continue...")
+    
     def _start_api_server(self):
         """Start API server."""
         print("\n[START] STARTING API SERVER...")
         
         # Check if API is already running (supervisor mode)
         try:
-            import requests
-            response = requests.get("http://localhost:5000/health", timeout=2)
+            response = _SESSION.get("http://localhost:5000/health", timeout=2)
             if response.status_code == 200:
                 print("[OK] API server already running (managed by supervisor)")
                 print("[INFO] In Docker mode, API runs automatically via supervisor")
@@ -559,7 +585,6 @@ class MenuController:
         
         # Check authentication
         print("\n[AUTH] Checking Cloudflare authentication...")
-        import os
         cert_path = os.path.expanduser("~/.cloudflared/cert.pem")
         
         if not os.path.exists(cert_path):
@@ -748,7 +773,6 @@ class MenuController:
         print("\n[INFO] API TOKENS:")
         
         try:
-            import requests
             api_status = self.system_status.api_service.get_status()
             
             if not api_status['running']:
@@ -758,7 +782,7 @@ class MenuController:
             # Get token information
             info_url = f"http://{api_status['host']}:{api_status['port']}/auth/info"
             
-            response = requests.get(info_url, timeout=2)
+            response = _SESSION.get(info_url, timeout=2)
             if response.status_code == 200:
                 data = response.json()
                 self._display_tokens(data['tokens'])
@@ -795,7 +819,6 @@ class MenuController:
         print("\n[KEY] GENERATE NEW API TOKEN:")
         
         try:
-            import requests
             api_status = self.system_status.api_service.get_status()
             
             if not api_status['running']:
@@ -804,7 +827,7 @@ class MenuController:
             
             # First check if there's a default token that can be retrieved
             info_url = f"http://{api_status['host']}:{api_status['port']}/auth/info"
-            info_response = requests.get(info_url, timeout=5)
+            info_response = _SESSION.get(info_url, timeout=5)
             
             if info_response.status_code == 200:
                 info_data = info_response.json()
@@ -828,7 +851,7 @@ class MenuController:
             if description:
                 payload["description"] = description
             
-            response = requests.post(url, json=payload, timeout=3)
+            response = _SESSION.post(url, json=payload, timeout=3)
             
             if response.status_code == 200:
                 data = response.json()
@@ -878,7 +901,6 @@ class MenuController:
             return
         
         try:
-            import requests
             api_status = self.system_status.api_service.get_status()
             url = f"http://{api_status['host']}:{api_status['port']}/auth/token/{name}"
             
@@ -886,7 +908,7 @@ class MenuController:
             token = input("Enter valid API token for authentication: ").strip()
             headers = {"Authorization": f"Bearer {token}"}
             
-            response = requests.delete(url, headers=headers, timeout=2)
+            response = _SESSION.delete(url, headers=headers, timeout=2)
             
             if response.status_code == 200:
                 print(f"[OK] Token '{name}' revoked successfully")
@@ -907,14 +929,13 @@ class MenuController:
             return
         
         try:
-            import requests
             api_status = self.system_status.api_service.get_status()
             
             # Test protected endpoint
             url = f"http://{api_status['host']}:{api_status['port']}/printer/status"
             headers = {"Authorization": f"Bearer {token}"}
             
-            response = requests.get(url, headers=headers, timeout=2)
+            response = _SESSION.get(url, headers=headers, timeout=2)
             
             if response.status_code == 200:
                 print("[OK] Authentication successful!")
@@ -967,8 +988,6 @@ class MenuController:
         print("\n[SEARCH] DEFAULT TOKEN:")
         
         try:
-            import subprocess
-            
             # Get the default token from container logs
             result = subprocess.run([
                 'docker', 'logs', 'zebra-print-control'
@@ -1016,12 +1035,11 @@ class MenuController:
         """Get token for testing - automatically use default token or prompt user."""
         try:
             # Get available tokens from API
-            import requests
             api_status = self.system_status.api_service.get_status()
             
             if api_status['running']:
                 info_url = f"http://{api_status['host']}:{api_status['port']}/auth/info"
-                response = requests.get(info_url, timeout=2)
+                response = _SESSION.get(info_url, timeout=2)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -1072,9 +1090,6 @@ class MenuController:
         try:
             # For now, we'll generate a temporary token for testing
             # In a real deployment, this would be stored securely
-            import requests
-            import secrets
-            
             api_status = self.system_status.api_service.get_status()
             
             # Try to get the actual token value by generating a new default token
@@ -1104,9 +1119,6 @@ class MenuController:
         print("Running Windows network connectivity tests...")
         
         try:
-            import socket
-            import platform
-            
             if platform.system() != "Windows":
                 print("[INFO] This diagnostic is designed for Windows")
                 print("[INFO] On other systems, check firewall and network settings")
@@ -1136,8 +1148,7 @@ class MenuController:
                     
                     # Try API health check
                     try:
-                        import requests
-                        response = requests.get(f"http://127.0.0.1:{self.system_status.api_service.port}/health", timeout=2)
+                        response = _SESSION.get(f"http://127.0.0.1:{self.system_status.api_service.port}/health", timeout=2)
                         if response.status_code == 200:
                             print("[OK] API health check successful")
                         else:
@@ -1156,7 +1167,6 @@ class MenuController:
             # Test 3: Windows Firewall check
             print(f"\n[TEST 3] Windows Firewall status...")
             try:
-                import subprocess
                 result = subprocess.run([
                     "netsh", "advfirewall", "show", "allprofiles", "state"
                 ], capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
@@ -1201,7 +1211,6 @@ class MenuController:
         print("Analyzing printer configuration...")
         
         try:
-            import platform
             if platform.system() != "Windows":
                 print("[INFO] This debug is designed for Windows")
                 return
@@ -1209,7 +1218,6 @@ class MenuController:
             # Test 1: Get detailed printer information
             print("\n[TEST 1] Printer Information...")
             try:
-                import subprocess
                 cmd = [
                     "powershell", "-Command",
                     "Get-Printer | Select-Object Name, PrinterStatus, PortName, DriverName | Format-Table -AutoSize"
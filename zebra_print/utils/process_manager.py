@@ -4,6 +4,7 @@ Provides utilities for managing background processes.
 """
 
 import os
+import select
 import signal
 import time
 from typing import Optional
@@ -23,9 +24,6 @@ class ProcessManager:
     @staticmethod
     def read_pid_file(pid_file: str) -> Optional[int]:
         """Read PID from file safely."""
-        if not os.path.exists(pid_file):
-            return None
-        
         try:
             with open(pid_file, 'r') as f:
                 return int(f.read().strip())
@@ -36,10 +34,14 @@ class ProcessManager:
     def write_pid_file(pid_file: str, pid: int) -> bool:
         """Write PID to file safely."""
         try:
-            with open(pid_file, 'w') as f:
-                f.write(str(pid))
+            # A few bytes; write them unbuffered rather than via a text wrapper
+            fd = os.open(pid_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, str(pid).encode('ascii'))
+            finally:
+                os.close(fd)
             return True
-        except IOError:
+        except OSError:
             return False
     
     @staticmethod
@@ -54,6 +56,46 @@ class ProcessManager:
                 pass
         return False
     
+    @staticmethod
+    def wait_for_exit(pid: int, timeout: float = 5.0) -> bool:
+        """Wait for a process to exit, returning False if it is still alive after timeout.
+        
+        Uses a pidfd where available so the wait ends as soon as the process
+        exits; otherwise polls with a short interval.
+        """
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except (AttributeError, OSError):
+            pidfd = None
+        
+        if pidfd is not None:
+            try:
+                readable, _, _ = select.select([pidfd], [], [], timeout)
+            finally:
+                os.close(pidfd)
+            if readable:
+                ProcessManager._reap(pid)
+            return bool(readable)
+        
+        deadline = time.monotonic() + timeout
+        while True:
+            ProcessManager._reap(pid)
+            if not ProcessManager.is_process_running(pid):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+    
+    @staticmethod
+    def _reap(pid: int):
+        """Collect the exit status if pid is our own child, so it doesn't linger as a zombie."""
+        try:
+            os.waitpid(pid, os.WNOHANG)
+        except (ChildProcessError, AttributeError, OSError):
+            pass
+    
     @staticmethod
     def terminate_process_group(pid: int, timeout: int = 5) -> bool:
         """Terminate a process group gracefully."""
@@ -61,15 +103,30 @@ class ProcessManager:
             # Send SIGTERM to the process group
             os.killpg(os.getpgid(pid), signal.SIGTERM)
             
-            # Wait for graceful termination
-            for _ in range(timeout):
-                if not ProcessManager.is_process_running(pid):
-                    return True
-                time.sleep(1)
+            # Wait for graceful termination, returning as soon as it exits
+            if ProcessManager.wait_for_exit(pid, timeout):
+                return True
             
             # Force kill if still running
             os.killpg(os.getpgid(pid), signal.SIGKILL)
             return True
             
         except (OSError, ProcessLookupError):
-            return True  # Already dead
\ No newline at end of file
+            return True  # Already dead
+    
+    @staticmethod
+    def read_log_tail(log_file: str, max_bytes: int = 500) -> str:
+        """Read the last max_bytes of a log file without loading the whole file."""
+        with open(log_file, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - max_bytes))
+            return f.read().decode('utf-8', errors='replace')
+    
+    @staticmethod
+    def read_cmdline(pid: int) -> Optional[str]:
+        """Return a process's command line from /proc, or None if it can't be read."""
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                return f.read().replace(b'\0', b' ').decode('utf-8', errors='replace').strip()
+        except OSError:
+            return None